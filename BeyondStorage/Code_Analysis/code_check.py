@@ -16,22 +16,27 @@ MSBUILD Integration Example:
 """
 
 import os
+import pickle
 import sys
-from typing import List, Dict, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Optional, Tuple
 
 # Configure UTF-8 output
 sys.stdout.reconfigure(encoding='utf-8')
 
 # Import our modular components
 from models import Issue, CheckResult
-from utils import clean_file_path, find_cs_files
-from roslyn_analyzer import RoslynAnalyzer, is_roslyn_available
-from string_checks import StringBasedChecker
+from utils import clean_file_path, find_cs_files, read_source_file
+from roslyn_analyzer import RoslynAnalyzer, is_roslyn_available, roslyn_status_message
+from string_checks import StringBasedChecker, AHOCORASICK_AVAILABLE
 from harmony_checks import HarmonyChecker
 from reporter import Reporter
 
 # Configuration constants
 ANALYSIS_OUTPUT_DIRECTORY = "./utils/analysis_results"
+PARALLEL_MIN_FILES = 10  # Below this, worker start-up costs more than checking the files serially
+RESULT_CACHE_FILE = os.path.join(ANALYSIS_OUTPUT_DIRECTORY, ".code_check_cache.pkl")
+RESULT_CACHE_VERSION = 1  # Bump when the cached data layout changes
 
 
 class CodeQualityChecker:
@@ -111,8 +116,7 @@ class CodeQualityChecker:
     def check_file(self, file_path: str) -> List[CheckResult]:
         """Check a single C# file for all registered issues"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = read_source_file(file_path)
         except (IOError, UnicodeDecodeError) as e:
             return [CheckResult(
                 check_name="file_read_error",
@@ -126,10 +130,13 @@ class CodeQualityChecker:
             )]
 
         results = []
+        # Split and strip once; every line-based check below shares these lists
+        lines = content.split('\n')
+        stripped_lines = [line.strip() for line in lines]
         
         # Run forbidden strings check
         if self.forbidden_strings:
-            issues = self.string_checker.check_forbidden_strings(file_path, content, self.forbidden_strings)
+            issues = self.string_checker.check_forbidden_strings(file_path, content, self.forbidden_strings, lines)
             if issues:
                 results.append(CheckResult(
                     check_name="forbidden_strings",
@@ -139,83 +146,89 @@ class CodeQualityChecker:
         # Run Roslyn-enhanced checks if available
         if self.roslyn_analyzer:
             # Parse file once for all Roslyn checks
-            syntax_tree, root = self.roslyn_analyzer.parse_file(file_path)
-            if syntax_tree and root:
+            parsed = self.roslyn_analyzer.parse_file(file_path, content)
+            if parsed:
+                # The tree is walked once at parse time and the collected nodes are shared across all checks
+                syntax_tree, root, nodes = parsed.syntax_tree, parsed.root, parsed.nodes
+                # Roslyn issues carry the raw path; clean it once for all of them
+                cleaned_path = clean_file_path(file_path)
+
                 # Harmony patch class checks
-                issues = self.roslyn_analyzer.check_harmony_patch_classes(file_path, syntax_tree, root)
+                issues = self.roslyn_analyzer.check_harmony_patch_classes(file_path, syntax_tree, root, nodes=nodes)
                 if issues:
                     for issue in issues:
-                        issue.file_path = clean_file_path(issue.file_path)
+                        issue.file_path = cleaned_path
                     results.append(CheckResult(
                         check_name="harmony_patch_classes_roslyn",
                         issues=issues
                     ))
                 
                 # Harmony patch method checks
-                issues = self.roslyn_analyzer.check_harmony_patch_methods(file_path, syntax_tree, root)
+                issues = self.roslyn_analyzer.check_harmony_patch_methods(file_path, syntax_tree, root, nodes=nodes)
                 if issues:
                     for issue in issues:
-                        issue.file_path = clean_file_path(issue.file_path)
+                        issue.file_path = cleaned_path
                     results.append(CheckResult(
                         check_name="harmony_patch_methods_roslyn",
                         issues=issues
                     ))
                 
                 # Empty catch blocks
-                issues = self.roslyn_analyzer.check_empty_catch_blocks(file_path, syntax_tree, root)
+                issues = self.roslyn_analyzer.check_empty_catch_blocks(file_path, syntax_tree, root, nodes=nodes)
                 if issues:
                     for issue in issues:
-                        issue.file_path = clean_file_path(issue.file_path)
+                        issue.file_path = cleaned_path
                     results.append(CheckResult(
                         check_name="empty_catch_blocks_roslyn",
                         issues=issues
                     ))
                 
                 # Magic numbers
-                issues = self.roslyn_analyzer.check_magic_numbers(file_path, syntax_tree, root)
+                issues = self.roslyn_analyzer.check_magic_numbers(file_path, syntax_tree, root, nodes=nodes, lines=parsed.lines)
                 if issues:
                     for issue in issues:
-                        issue.file_path = clean_file_path(issue.file_path)
+                        issue.file_path = cleaned_path
                     results.append(CheckResult(
                         check_name="magic_numbers_roslyn",
                         issues=issues
                     ))
                 
                 # Cyclomatic complexity
-                issues = self.roslyn_analyzer.check_cyclomatic_complexity(file_path, syntax_tree, root)
+                issues = self.roslyn_analyzer.check_cyclomatic_complexity(file_path, syntax_tree, root, nodes=nodes)
                 if issues:
                     for issue in issues:
-                        issue.file_path = clean_file_path(issue.file_path)
+                        issue.file_path = cleaned_path
                     results.append(CheckResult(
                         check_name="cyclomatic_complexity_roslyn",
                         issues=issues
                     ))
 
                 # Excessive nesting (Roslyn-preferred)
-                issues = self.roslyn_analyzer.check_excessive_nesting(file_path, syntax_tree, root)
+                issues = self.roslyn_analyzer.check_excessive_nesting(file_path, syntax_tree, root, nodes=nodes)
                 if issues:
                     for issue in issues:
-                        issue.file_path = clean_file_path(issue.file_path)
+                        issue.file_path = cleaned_path
                     results.append(CheckResult(
                         check_name="excessive_nesting_roslyn",
                         issues=issues
                     ))
             else:
                 # Fallback to string-based checks if Roslyn parsing fails
-                self._run_string_based_checks(file_path, content, results)
+                self._run_string_based_checks(file_path, content, lines, stripped_lines, results)
         else:
             # Run string-based checks if Roslyn is not available
-            self._run_string_based_checks(file_path, content, results)
+            self._run_string_based_checks(file_path, content, lines, stripped_lines, results)
         
         # Always run these string-based checks
-        self._run_additional_string_checks(file_path, content, results)
+        self._run_additional_string_checks(file_path, content, lines, stripped_lines, results)
         
         return results
     
-    def _run_string_based_checks(self, file_path: str, content: str, results: List[CheckResult]):
+    def _run_string_based_checks(self, file_path: str, content: str, lines: List[str], stripped_lines: List[str],
+                                 results: List[CheckResult]):
         """Run string-based versions of core checks when Roslyn is not available"""
         # Harmony patch class checks
-        issues = self.harmony_checker.check_harmony_patch_class_declaration(file_path, content)
+        issues = self.harmony_checker.check_harmony_patch_class_declaration(file_path, content, lines, stripped_lines)
         if issues:
             results.append(CheckResult(
                 check_name="harmony_patch_classes_string",
@@ -223,97 +236,80 @@ class CodeQualityChecker:
             ))
         
         # Harmony patch method checks
-        issues = self.harmony_checker.check_harmony_patch_method_declaration(file_path, content)
+        issues = self.harmony_checker.check_harmony_patch_method_declaration(file_path, content, lines, stripped_lines)
         if issues:
             results.append(CheckResult(
                 check_name="harmony_patch_methods_string",
                 issues=issues
             ))
         
-        # Empty catch blocks
-        issues = self.string_checker.check_empty_catch_blocks(file_path, content)
-        if issues:
-            results.append(CheckResult(
-                check_name="empty_catch_blocks_string",
-                issues=issues
-            ))
-        
-        # Magic numbers
-        issues = self.string_checker.check_magic_numbers(file_path, content)
-        if issues:
-            results.append(CheckResult(
-                check_name="magic_numbers_string",
-                issues=issues
-            ))
-        
-        # Cyclomatic complexity
-        issues = self.string_checker.check_cyclomatic_complexity(file_path, content)
-        if issues:
-            results.append(CheckResult(
-                check_name="cyclomatic_complexity_string",
-                issues=issues
-            ))
-
-        # Excessive nesting (string fallback)
-        issues = self.string_checker.check_excessive_nesting(file_path, content)
-        if issues:
-            results.append(CheckResult(
-                check_name="excessive_nesting_string",
-                issues=issues
-            ))
+        # Empty catch blocks, magic numbers, cyclomatic complexity and excessive nesting,
+        # all from a single pass over the file
+        fallback_check_issues = self.string_checker.run_fallback_checks(file_path, content, lines, stripped_lines)
+        for check_name, issues in fallback_check_issues.items():
+            if issues:
+                results.append(CheckResult(
+                    check_name=f"{check_name}_string",
+                    issues=issues
+                ))
     
-    def _run_additional_string_checks(self, file_path: str, content: str, results: List[CheckResult]):
+    def _run_additional_string_checks(self, file_path: str, content: str, lines: List[str], stripped_lines: List[str],
+                                      results: List[CheckResult]):
         """Run additional string-based checks that are always performed"""
-        # TODO comments
-        issues = self.string_checker.check_todo_comments(file_path, content)
-        if issues:
-            results.append(CheckResult(
-                check_name="todo_comments",
-                issues=issues
-            ))
-        
-        # Null checks
-        issues = self.string_checker.check_null_checks(file_path, content)
-        if issues:
-            results.append(CheckResult(
-                check_name="null_checks",
-                issues=issues
-            ))
-        
-        # Disposable usage
-        issues = self.string_checker.check_disposable_usage(file_path, content)
-        if issues:
-            results.append(CheckResult(
-                check_name="disposable_usage",
-                issues=issues
-            ))
-        
-        # String interpolation
-        issues = self.string_checker.check_string_interpolation(file_path, content)
-        if issues:
-            results.append(CheckResult(
-                check_name="string_interpolation",
-                issues=issues
-            ))
-        
-        # String in loops
-        issues = self.string_checker.check_string_in_loops(file_path, content)
-        if issues:
-            results.append(CheckResult(
-                check_name="string_in_loops",
-                issues=issues
-            ))
-        
-        # LINQ performance
-        issues = self.string_checker.check_linq_performance(file_path, content)
-        if issues:
-            results.append(CheckResult(
-                check_name="linq_performance",
-                issues=issues
-            ))
+        # TODO comments, null checks, disposable usage, string interpolation, string in loops
+        # and LINQ performance, all from a single pass over the file
+        line_check_issues = self.string_checker.run_line_checks(file_path, content, lines, stripped_lines)
+        for check_name, issues in line_check_issues.items():
+            if issues:
+                results.append(CheckResult(
+                    check_name=check_name,
+                    issues=issues
+                ))
+    
+    def _result_cache_signature(self) -> Tuple:
+        """
+        Everything besides a file's own content that its results depend on: the checker sources,
+        the forbidden string table, Roslyn availability and the working directory paths are relative to
+        """
+        checker_dir = os.path.dirname(os.path.abspath(__file__))
+        source_stamps = []
+        with os.scandir(checker_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith('.py'):
+                    stat = entry.stat()
+                    source_stamps.append((entry.name, stat.st_mtime_ns, stat.st_size))
+        return (
+            RESULT_CACHE_VERSION,
+            os.getcwd(),
+            is_roslyn_available(),
+            tuple(sorted(source_stamps)),
+            tuple(self.forbidden_strings.items()),
+        )
+    
+    def _load_result_cache(self, cache_signature: Tuple) -> Dict[str, Tuple[Tuple[int, int], List[CheckResult]]]:
+        """Load per-file results saved by the previous run, or nothing if they were made under other conditions"""
+        try:
+            with open(RESULT_CACHE_FILE, 'rb') as f:
+                saved_signature, cached_files = pickle.load(f)
+        except (OSError, EOFError, ImportError, AttributeError, ValueError, TypeError, pickle.UnpicklingError):
+            return {}
+        return cached_files if saved_signature == cache_signature else {}
     
-    def run_all_checks(self, root_dir: str = ".") -> bool:
-        """Run all checks on all C# files and return True if no errors found"""
+    def _save_result_cache(self, cache_signature: Tuple, cached_files: Dict[str, Tuple[Tuple[int, int], List[CheckResult]]]):
+        """Save per-file results for the next run; written aside and renamed so a partial file is never read"""
+        temp_file = RESULT_CACHE_FILE + ".tmp"
+        try:
+            with open(temp_file, 'wb') as f:
+                pickle.dump((cache_signature, cached_files), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_file, RESULT_CACHE_FILE)
+        except OSError as e:
+            print(f"Warning: Could not write result cache {RESULT_CACHE_FILE}: {e}")
+    
+    def run_all_checks(self, root_dir: str = ".", use_result_cache: bool = True) -> bool:
+        """
+        Run all checks on all C# files and return True if no errors found.
+        With use_result_cache, files unchanged since the previous run reuse that run's results.
+        """
         print("BeyondStorage Code Quality Checker")
         print("=" * 50)
         
@@ -324,6 +320,13 @@ class CodeQualityChecker:
         else:
             print("⚠ Roslyn AST parsing: DISABLED - using string-based parsing")
             print("  To enable: pip install pythonnet and ensure Roslyn assemblies are available")
+        
+        # Show native multi-pattern matcher status
+        if AHOCORASICK_AVAILABLE:
+            print("✓ Aho-Corasick forbidden string matching: ENABLED")
+        else:
+            print("⚠ Aho-Corasick forbidden string matching: DISABLED - using one scan per pattern")
+            print("  To enable: pip install pyahocorasick")
         print()
         
         # Clean up old result files first
@@ -342,8 +345,46 @@ class CodeQualityChecker:
         
         all_issues = []
         
-        for file_path in cs_files:
-            results = self.check_file(file_path)
+        # Reuse the results of files unchanged since the last run (same path, mtime and size)
+        cache_signature = self._result_cache_signature()
+        cached_files = self._load_result_cache(cache_signature) if use_result_cache else {}
+        file_keys = [_file_cache_key(file_path) for file_path in cs_files]
+        file_results = [None] * len(cs_files)
+        stale_indexes = []
+        for index, (file_path, file_key) in enumerate(zip(cs_files, file_keys)):
+            cached = cached_files.get(file_path)
+            if file_key is not None and cached is not None and cached[0] == file_key:
+                file_results[index] = cached[1]
+            else:
+                stale_indexes.append(index)
+        stale_files = [cs_files[index] for index in stale_indexes]
+        
+        if len(stale_files) < len(cs_files):
+            print(f"Reusing cached results for {len(cs_files) - len(stale_files)} unchanged file(s)")
+            print()
+        
+        # Files are independent, so spread them across one worker process per core
+        workers = min(os.cpu_count() or 1, len(stale_files))
+        if workers > 1 and len(stale_files) >= PARALLEL_MIN_FILES:
+            chunksize = max(1, len(stale_files) // (4 * workers))
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(self.forbidden_strings,)) as executor:
+                checked_results = list(executor.map(_check_file_in_worker, stale_files, chunksize=chunksize))
+        else:
+            checked_results = [self.check_file(file_path) for file_path in stale_files]
+        
+        for index, results in zip(stale_indexes, checked_results):
+            file_results[index] = results
+        
+        if use_result_cache:
+            self._save_result_cache(cache_signature, {
+                file_path: (file_key, results)
+                for file_path, file_key, results in zip(cs_files, file_keys, file_results)
+                if file_key is not None
+            })
+        
+        # Results sit at their file's index whether cached or freshly checked, so the report order matches a serial run
+        for results in file_results:
             for result in results:
                 all_issues.extend(result.issues)
         
@@ -362,12 +403,38 @@ class CodeQualityChecker:
         return len(errors) == 0
 
 
+def _file_cache_key(file_path: str) -> Optional[Tuple[int, int]]:
+    """Modification time and size identifying a file's current content, or None if it cannot be read"""
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+# Per-process checker used by the worker pool in run_all_checks
+_worker_checker = None
+
+
+def _init_worker(forbidden_strings: Dict[str, Tuple[str, str, str]]):
+    """Build one checker per worker process, with the same forbidden strings as the parent"""
+    global _worker_checker
+    _worker_checker = CodeQualityChecker()
+    _worker_checker.forbidden_strings = dict(forbidden_strings)
+
+
+def _check_file_in_worker(file_path: str) -> List[CheckResult]:
+    """Check a single file in a worker process"""
+    return _worker_checker.check_file(file_path)
+
+
 def main():
     """Main entry point"""
+    print(roslyn_status_message())
     checker = CodeQualityChecker()
     
-    # Run all checks
-    success = checker.run_all_checks()
+    # Run all checks (--no-cache re-checks every file instead of reusing unchanged files' results)
+    success = checker.run_all_checks(use_result_cache='--no-cache' not in sys.argv[1:])
     
     # Set exit code: 0 for success (no errors), 1 for errors found
     sys.exit(0 if success else 1)
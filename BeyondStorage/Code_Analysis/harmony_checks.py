@@ -119,14 +119,19 @@ class HarmonyChecker:
         stripped = line.strip()
         return stripped.startswith('#if') or stripped.startswith('#endif') or stripped.startswith('#else')
     
-    def check_harmony_patch_class_declaration(self, file_path: str, content: str) -> List[Issue]:
+    def check_harmony_patch_class_declaration(self, file_path: str, content: str, lines: Optional[List[str]] = None,
+                                              stripped_lines: Optional[List[str]] = None) -> List[Issue]:
         """Check that classes with [HarmonyPatch] attribute are declared as internal static - ERROR"""
         issues = []
-        lines = content.split('\n')
+        cleaned_path = clean_file_path(file_path)
+        if lines is None:
+            lines = content.split('\n')
+        if stripped_lines is None:
+            stripped_lines = [line.strip() for line in lines]
         
         i = 0
         while i < len(lines):
-            line = lines[i].strip()
+            line = stripped_lines[i]
             
             # Skip empty lines and comments
             if not line or line.startswith('//') or line.startswith('*'):
@@ -142,7 +147,7 @@ class HarmonyChecker:
                 # Look ahead for the declaration (skip other attributes and empty lines)
                 j = i + 1
                 while j < len(lines):
-                    next_line = lines[j].strip()
+                    next_line = stripped_lines[j]
                     
                     # Skip empty lines, comments, preprocessor directives, and other attributes
                     if (not next_line or 
@@ -178,7 +183,7 @@ class HarmonyChecker:
                                 missing = "static"
                             
                             issues.append(Issue(
-                                file_path=clean_file_path(file_path),
+                                file_path=cleaned_path,
                                 line_number=declaration_line_num,
                                 severity="error",
                                 code="BCS050",
@@ -203,7 +208,7 @@ class HarmonyChecker:
                 # If no declaration found after HarmonyPatch attribute, that's unusual
                 if not declaration_found:
                     issues.append(Issue(
-                        file_path=clean_file_path(file_path),
+                        file_path=cleaned_path,
                         line_number=i + 1,
                         severity="error", 
                         code="BCS051",
@@ -216,17 +221,22 @@ class HarmonyChecker:
         
         return issues
 
-    def check_harmony_patch_method_declaration(self, file_path: str, content: str) -> List[Issue]:
+    def check_harmony_patch_method_declaration(self, file_path: str, content: str, lines: Optional[List[str]] = None,
+                                               stripped_lines: Optional[List[str]] = None) -> List[Issue]:
         """Check that methods with Harmony attributes are declared as private - ERROR"""
         issues = []
-        lines = content.split('\n')
+        cleaned_path = clean_file_path(file_path)
+        if lines is None:
+            lines = content.split('\n')
+        if stripped_lines is None:
+            stripped_lines = [line.strip() for line in lines]
         
         # Only check method-level Harmony attributes (not HarmonyPatch which can be on classes)
         harmony_method_attributes = ['HarmonyPrefix', 'HarmonyPostfix', 'HarmonyTranspiler', 'HarmonyFinalizer']
         
         i = 0
         while i < len(lines):
-            line = lines[i].strip()
+            line = stripped_lines[i]
             
             # Skip empty lines and comments
             if not line or line.startswith('//') or line.startswith('*'):
@@ -248,7 +258,7 @@ class HarmonyChecker:
                 all_attributes = [attr_name]
                 k = i + 1
                 while k < len(lines):
-                    next_attr_line = lines[k].strip()
+                    next_attr_line = stripped_lines[k]
                     if not next_attr_line or next_attr_line.startswith('//') or next_attr_line.startswith('*') or self._is_preprocessor_directive(next_attr_line):
                         k += 1
                         continue
@@ -269,7 +279,7 @@ class HarmonyChecker:
                 
                 j = k
                 while j < len(lines):
-                    next_line = lines[j].strip()
+                    next_line = stripped_lines[j]
                     
                     # Skip empty lines, comments, preprocessor directives, and other attributes
                     if (not next_line or 
@@ -307,7 +317,7 @@ class HarmonyChecker:
                             
                             if not has_private:
                                 issues.append(Issue(
-                                    file_path=clean_file_path(file_path),
+                                    file_path=cleaned_path,
                                     line_number=method_line_num,
                                     severity="error",
                                     code="BCS052",
@@ -317,7 +327,7 @@ class HarmonyChecker:
                             # If it's a transpiler method, check for method calls
                             elif is_transpiler:
                                 transpiler_issues = self._check_transpiler_method_calls_simple(
-                                    lines, j, method_name, file_path, content
+                                    lines, stripped_lines, j, method_name, file_path, content
                                 )
                                 issues.extend(transpiler_issues)
                             
@@ -331,7 +341,7 @@ class HarmonyChecker:
                 # If no method declaration found after Harmony attribute
                 if not method_found:
                     issues.append(Issue(
-                        file_path=clean_file_path(file_path),
+                        file_path=cleaned_path,
                         line_number=i + 1,
                         severity="error", 
                         code="BCS054",
@@ -344,9 +354,10 @@ class HarmonyChecker:
         
         return issues
 
-    def _check_transpiler_method_calls_simple(self, lines: List[str], method_start: int, transpiler_name: str, file_path: str, content: str) -> List[Issue]:
+    def _check_transpiler_method_calls_simple(self, lines: List[str], stripped_lines: List[str], method_start: int, transpiler_name: str, file_path: str, content: str) -> List[Issue]:
         """Simple string-based check for transpiler method calls"""
         issues = []
+        cleaned_path = clean_file_path(file_path)
         
         try:
             # Find the end of the method (simple brace counting)
@@ -354,7 +365,7 @@ class HarmonyChecker:
             method_end = len(lines)
             
             for i in range(method_start, len(lines)):
-                line = lines[i].strip()
+                line = stripped_lines[i]
                 if not line or line.startswith('//'):
                     continue
                 
@@ -365,7 +376,7 @@ class HarmonyChecker:
             
             # Get all method names in the file and their visibility
             method_visibility = {}
-            all_lines = content.split('\n')
+            all_lines = lines
             
             for line_num, line in enumerate(all_lines, 1):
                 # Look for method declarations - simple check for modifiers and parentheses
@@ -395,7 +406,7 @@ class HarmonyChecker:
             
             # Check method calls within the transpiler method
             for i in range(method_start, method_end):
-                line = lines[i].strip()
+                line = stripped_lines[i]
                 line_num = i + 1
                 
                 if not line or line.startswith('//'):
@@ -430,7 +441,7 @@ class HarmonyChecker:
                                 # If it's not private and not a public static utility, flag it
                                 if not method_info['is_private']:
                                     issues.append(Issue(
-                                        file_path=clean_file_path(file_path),
+                                        file_path=cleaned_path,
                                         line_number=line_num,
                                         severity="error",
                                         code="BCS053",
@@ -8,6 +8,9 @@ from typing import List
 @dataclass
 class Issue:
     """Represents a single code quality issue"""
+    # Issues are created in bulk; slots drop the per-instance __dict__ (no field defaults, so valid on any 3.x)
+    __slots__ = ('file_path', 'line_number', 'severity', 'code', 'description')
+    
     file_path: str
     line_number: int
     severity: str  # "error" or "warning"
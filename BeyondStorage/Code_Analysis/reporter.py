@@ -3,12 +3,16 @@ Code analysis reporting functionality
 """
 
 import os
+import sys
 import glob
 import re
 from datetime import datetime
-from typing import List
+from typing import Iterator, List
 from models import Issue
 
+# Results file buffer; a large report is written in a few big chunks instead of many small ones
+REPORT_WRITE_BUFFER_SIZE = 64 * 1024
+
 
 class Reporter:
     """Handles reporting and output formatting for code analysis results"""
@@ -118,67 +122,76 @@ class Reporter:
         return deleted_count
     
     @staticmethod
-    def write_results(output_directory: str, errors: List[Issue], warnings: List[Issue], cs_files_count: int, parsing_method: str) -> str:
-        """Write results to timestamped file and return filename"""
-        # Ensure output directory exists
-        if not os.path.exists(output_directory):
-            os.makedirs(output_directory)
-        
-        # Create timestamped results file
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        results_filename = f"code_check_results_{timestamp}.txt"
-        results_file = os.path.join(output_directory, results_filename)
-        
-        # Output to both console and file
-        output_lines = []
-        
+    def _iter_report_lines(errors: List[Issue], warnings: List[Issue], cs_files_count: int, parsing_method: str) -> Iterator[str]:
+        """Yield the report body line by line, as shown on the console and written to the results file"""
         # Show warnings first (less critical)
         if warnings:
-            output_lines.append("WARNINGS:")
-            output_lines.append("-" * 40)
+            yield "WARNINGS:"
+            yield "-" * 40
             for warning in warnings:
-                line = Reporter.format_issue_compiler_style(warning)
-                output_lines.append(line)
-            output_lines.append("")
+                yield Reporter.format_issue_compiler_style(warning)
+            yield ""
 
         # Show errors last (most critical - will be at bottom of output)
         if errors:
-            output_lines.append("ERRORS:")
-            output_lines.append("-" * 40)
+            yield "ERRORS:"
+            yield "-" * 40
             for error in errors:
-                line = Reporter.format_issue_compiler_style(error)
-                output_lines.append(line)
-            output_lines.append("")
+                yield Reporter.format_issue_compiler_style(error)
+            yield ""
         
         # Summary
-        summary = f"Code check completed: {len(errors)} error(s), {len(warnings)} warning(s) found in {cs_files_count} files."
-        output_lines.append(summary)
+        yield f"Code check completed: {len(errors)} error(s), {len(warnings)} warning(s) found in {cs_files_count} files."
         
         # Add build status indicator
         if errors:
-            output_lines.append("BUILD STATUS: FAILED (errors found)")
+            yield "BUILD STATUS: FAILED (errors found)"
         elif warnings:
-            output_lines.append("BUILD STATUS: PASSED (warnings only)")
+            yield "BUILD STATUS: PASSED (warnings only)"
         else:
-            output_lines.append("BUILD STATUS: PASSED (no issues)")
+            yield "BUILD STATUS: PASSED (no issues)"
         
         # Add parsing method info
-        output_lines.append(f"PARSING METHOD: {parsing_method}")
+        yield f"PARSING METHOD: {parsing_method}"
+    
+    @staticmethod
+    def write_results(output_directory: str, errors: List[Issue], warnings: List[Issue], cs_files_count: int, parsing_method: str) -> str:
+        """Write results to timestamped file and return filename (empty if no issues, so no file was written)"""
+        # A clean run only needs the console summary; don't leave a results file behind for it
+        if not errors and not warnings:
+            for line in Reporter._iter_report_lines(errors, warnings, cs_files_count, parsing_method):
+                print(line)
+            return ""
+        
+        # Ensure output directory exists
+        if not os.path.exists(output_directory):
+            os.makedirs(output_directory)
         
-        # Write to file
+        # Create timestamped results file
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        results_filename = f"code_check_results_{timestamp}.txt"
+        results_file = os.path.join(output_directory, results_filename)
+        
+        # Output to both console and file, streaming each line to both as it is formatted
+        # instead of collecting the whole report in memory first
         try:
-            with open(results_file, 'w', encoding='utf-8') as f:
+            with open(results_file, 'w', encoding='utf-8', buffering=REPORT_WRITE_BUFFER_SIZE) as f:
                 f.write(f"BeyondStorage Code Quality Check Results\n")
                 f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
                 f.write(f"Parsing Method: {parsing_method}\n")
                 f.write("=" * 60 + "\n\n")
-                f.write("\n".join(output_lines))
+                
+                console_write = sys.stdout.write
+                separator = ""
+                for line in Reporter._iter_report_lines(errors, warnings, cs_files_count, parsing_method):
+                    # Lines are newline-separated in the file (no trailing newline), newline-terminated on the console
+                    f.write(separator)
+                    f.write(line)
+                    separator = "\n"
+                    console_write(line)
+                    console_write("\n")
         except IOError as e:
             print(f"Warning: Could not write results file {results_file}: {e}")
             return ""
         
-        # Output to console
-        for line in output_lines:
-            print(line)
-        
         return results_file
\ No newline at end of file
@@ -2,11 +2,62 @@
 Roslyn-based C# code analyzer for enhanced accuracy
 """
 
-from typing import List, Tuple, Optional
+import os
+import re
+from collections import OrderedDict
+from typing import List, NamedTuple, Tuple, Optional
 from models import Issue
 
+# Issues are staged as (line_number, severity, code, description) tuples while walking
+# the syntax tree, and only turned into Issue objects once per check
+RawIssue = Tuple[int, str, str, str]
+
+# The C# new-line characters, which Roslyn's SourceText.Lines breaks on. str.splitlines() also
+# breaks on \x0b, \x0c and \x1c-\x1e, which would shift every later line index.
+_LINE_BREAK_RE = re.compile('\r\n|[\r\n\u0085\u2028\u2029]')
+
+
+class SyntaxNodeBuckets(NamedTuple):
+    """Nodes of interest to the checks, collected in a single DescendantNodes() walk"""
+    classes: list
+    methods: list
+    # Subsets of methods, in source order: block-bodied only, and block- or expression-bodied
+    # (abstract/extern/interface methods have neither and are skipped by the metric checks)
+    methods_with_body: list
+    methods_with_code: list
+    catch_clauses: list
+    literals: list
+
+
+class ParsedFile(NamedTuple):
+    """Everything the checks need from one parse of a C# file"""
+    syntax_tree: object
+    root: object
+    lines: List[str]
+    nodes: SyntaxNodeBuckets
+
+
+# Method-level Harmony attributes, by simple name (no namespace, no "Attribute" suffix)
+_HARMONY_ATTR_NAMES = frozenset({
+    "HarmonyPatch",
+    "HarmonyPrefix",
+    "HarmonyPostfix",
+    "HarmonyTranspiler",
+    "HarmonyFinalizer",
+})
+
+
+def _simple_attribute_name(attr_name: str) -> str:
+    """Reduce e.g. 'HarmonyLib.HarmonyPatchAttribute' to 'HarmonyPatch'"""
+    name = attr_name.rsplit('.', 1)[-1]
+    if name.endswith("Attribute"):
+        name = name[:-len("Attribute")]
+    return name
+
 # Try to import Roslyn for enhanced C# parsing
 ROSLYN_AVAILABLE = False
+# Reported by the entry point rather than printed here: worker processes spawned on Windows re-import this module
+ROSLYN_STATUS_MESSAGE = ""
 try:
     import clr
     # Add references to .NET Framework assemblies (compatible with .NET Framework 4.8)
@@ -35,29 +86,19 @@ try:
             InvocationExpressionSyntax,
             MemberAccessExpressionSyntax,
             ThrowStatementSyntax,
-            # For nesting analysis
-            IfStatementSyntax,
-            ElseClauseSyntax,
-            ForStatementSyntax,
-            ForEachStatementSyntax,
-            WhileStatementSyntax,
-            DoStatementSyntax,
-            SwitchStatementSyntax,
-            TryStatementSyntax,
-            UsingStatementSyntax,
-            LockStatementSyntax,
-            FixedStatementSyntax,
-            BlockSyntax
+            # For const detection
+            FieldDeclarationSyntax,
+            LocalDeclarationStatementSyntax
         )
         
         ROSLYN_AVAILABLE = True
-        print("Roslyn C# parsing enabled - enhanced accuracy for selected checks")
+        ROSLYN_STATUS_MESSAGE = "Roslyn C# parsing enabled - enhanced accuracy for selected checks"
     except Exception as e:
-        print(f"Roslyn not available, using string-based parsing: {e}")
+        ROSLYN_STATUS_MESSAGE = f"Roslyn not available, using string-based parsing: {e}"
         ROSLYN_AVAILABLE = False
         
 except ImportError:
-    print("Python.NET not available - using string-based parsing only")
+    ROSLYN_STATUS_MESSAGE = "Python.NET not available - using string-based parsing only"
     ROSLYN_AVAILABLE = False
 
 
@@ -71,40 +112,116 @@ class RoslynAnalyzer:
         self.acceptable_float_values = {0.5, 0.25, 0.75, 1.5, 2.5}
         self.float_min_abs_threshold = 1.0   # Flag floats/decimals with |value| >= this
         self.decimal_min_abs_threshold = 1.0
+        # Count decision points using specific syntax kinds, compared by RawKind (a plain int)
+        # Avoid double counting switch + cases: count only cases/default
+        self.complexity_raw_kinds = frozenset(int(kind) for kind in (
+            SyntaxKind.IfStatement,
+            SyntaxKind.WhileStatement,
+            SyntaxKind.ForStatement,
+            SyntaxKind.ForEachStatement,
+            SyntaxKind.DoStatement,
+            SyntaxKind.CatchClause,
+            SyntaxKind.ConditionalExpression,  # ? :
+            SyntaxKind.CaseSwitchLabel,
+            SyntaxKind.DefaultSwitchLabel,
+            # Logical operators
+            SyntaxKind.LogicalAndExpression,
+            SyntaxKind.LogicalOrExpression,
+        ))
+        # Nesting analysis: constructs that open a nesting level, also compared by RawKind
+        self.if_raw_kind = int(SyntaxKind.IfStatement)
+        self.switch_raw_kind = int(SyntaxKind.SwitchStatement)
+        self.try_raw_kind = int(SyntaxKind.TryStatement)
+        self.block_raw_kind = int(SyntaxKind.Block)
+        self.nesting_control_raw_kinds = frozenset(int(kind) for kind in (
+            SyntaxKind.IfStatement,
+            SyntaxKind.SwitchStatement,
+            SyntaxKind.TryStatement,
+            # loops
+            SyntaxKind.ForStatement,
+            SyntaxKind.ForEachStatement,
+            SyntaxKind.WhileStatement,
+            SyntaxKind.DoStatement,
+            # using / lock / fixed
+            SyntaxKind.UsingStatement,
+            SyntaxKind.LockStatement,
+            SyntaxKind.FixedStatement,
+        ))
+        # Parsed files, least recently used first
+        self.parse_cache_size = 256
+        self._parse_cache: "OrderedDict[Tuple[str, int, int], ParsedFile]" = OrderedDict()
     
-    def parse_file(self, file_path: str) -> Tuple[Optional[SyntaxTree], Optional[CompilationUnitSyntax]]:
-        """Parse C# file using Roslyn"""
+    def parse_file(self, file_path: str, source_code: Optional[str] = None) -> Optional[ParsedFile]:
+        """
+        Parse C# file using Roslyn.
+        Results are cached on (path, mtime, size), so re-analyzing an unchanged file skips both the
+        parse and the node collection. Pass source_code when the caller has already read the file.
+        """
         if not ROSLYN_AVAILABLE:
-            return None, None
+            return None
             
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                source_code = f.read()
+            stat = os.stat(file_path)
+            cache_key = (file_path, stat.st_mtime_ns, stat.st_size)
+            parsed = self._parse_cache.get(cache_key)
+            if parsed is not None:
+                self._parse_cache.move_to_end(cache_key)
+                return parsed
+
+            if source_code is None:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    source_code = f.read()
             
             # Parse the source code into a syntax tree
             syntax_tree = CSharpSyntaxTree.ParseText(source_code)
             root = syntax_tree.GetCompilationUnitRoot()
             
-            return syntax_tree, root
+            parsed = ParsedFile(syntax_tree, root, _LINE_BREAK_RE.split(source_code), self.collect_nodes(root))
+            self._parse_cache[cache_key] = parsed
+            if len(self._parse_cache) > self.parse_cache_size:
+                self._parse_cache.popitem(last=False)
+            return parsed
         except Exception as e:
             print(f"Failed to parse {file_path} with Roslyn: {e}")
-            return None, None
+            return None
+
+    def collect_nodes(self, root: CompilationUnitSyntax) -> SyntaxNodeBuckets:
+        """Walk the tree once and bucket the node types the checks care about"""
+        buckets = SyntaxNodeBuckets([], [], [], [], [], [])
+        # Each DescendantNodes() walk crosses the CLR boundary once per node, so every
+        # check shares this pass instead of enumerating the whole tree itself
+        for node in root.DescendantNodes():
+            if isinstance(node, MethodDeclarationSyntax):
+                buckets.methods.append(node)
+                if node.Body is not None:
+                    buckets.methods_with_body.append(node)
+                    buckets.methods_with_code.append(node)
+                elif node.ExpressionBody is not None:
+                    buckets.methods_with_code.append(node)
+            elif isinstance(node, LiteralExpressionSyntax):
+                buckets.literals.append(node)
+            elif isinstance(node, ClassDeclarationSyntax):
+                buckets.classes.append(node)
+            elif isinstance(node, CatchClauseSyntax):
+                buckets.catch_clauses.append(node)
+        return buckets
 
     # Harmony Patch class checks
-    def check_harmony_patch_classes(self, file_path: str, syntax_tree: SyntaxTree, root: CompilationUnitSyntax) -> List[Issue]:
+    def check_harmony_patch_classes(self, file_path: str, syntax_tree: SyntaxTree, root: CompilationUnitSyntax, nodes: Optional[SyntaxNodeBuckets] = None) -> List[Issue]:
         """Check HarmonyPatch class declarations using Roslyn AST"""
-        issues: List[Issue] = []
+        raw_issues: List[RawIssue] = []
         try:
-            all_nodes = list(root.DescendantNodes())
-            classes = [node for node in all_nodes if isinstance(node, ClassDeclarationSyntax)]
+            if nodes is None:
+                nodes = self.collect_nodes(root)
+            classes = nodes.classes
             
             for class_decl in classes:
                 # Check if class has HarmonyPatch attribute
                 harmony_attr = None
                 for attr_list in class_decl.AttributeLists:
                     for attr in attr_list.Attributes:
-                        attr_name = str(attr.Name) if hasattr(attr, "Name") else str(attr)
-                        if "harmonypatch" in attr_name.lower():
+                        attr_name = _simple_attribute_name(str(attr.Name))
+                        if attr_name == "HarmonyPatch":
                             harmony_attr = attr
                             break
                     if harmony_attr:
@@ -112,7 +229,8 @@ class RoslynAnalyzer:
                 
                 if harmony_attr:
                     # Check modifiers using Roslyn's proper parsing
-                    modifiers = [getattr(mod, "ValueText", str(mod)).lower() for mod in class_decl.Modifiers]
+                    # (modifier keyword ValueText is always lowercase)
+                    modifiers = {mod.ValueText for mod in class_decl.Modifiers}
                     has_internal = "internal" in modifiers
                     has_static = "static" in modifiers
 
@@ -127,25 +245,25 @@ class RoslynAnalyzer:
                             missing.append("static")
                         
                         class_name = str(class_decl.Identifier)
-                        issues.append(Issue(
-                            file_path=file_path,
-                            line_number=class_line,
-                            severity="error",
-                            code="BCS050",
-                            description=f"Class '{class_name}' with [HarmonyPatch] must be 'internal static' (missing: {' '.join(missing)})"
+                        raw_issues.append((
+                            class_line,
+                            "error",
+                            "BCS050",
+                            f"Class '{class_name}' with [HarmonyPatch] must be 'internal static' (missing: {' '.join(missing)})"
                         ))
         except Exception as e:
             print(f"Error in Roslyn HarmonyPatch check for {file_path}: {e}")
         
-        return issues
+        return [Issue(file_path, *raw) for raw in raw_issues]
 
     # Harmony Patch method checks
-    def check_harmony_patch_methods(self, file_path: str, syntax_tree: SyntaxTree, root: CompilationUnitSyntax) -> List[Issue]:
+    def check_harmony_patch_methods(self, file_path: str, syntax_tree: SyntaxTree, root: CompilationUnitSyntax, nodes: Optional[SyntaxNodeBuckets] = None) -> List[Issue]:
         """Check HarmonyPatch method declarations using Roslyn AST"""
-        issues: List[Issue] = []
+        raw_issues: List[RawIssue] = []
         try:
-            all_nodes = list(root.DescendantNodes())
-            methods = [node for node in all_nodes if isinstance(node, MethodDeclarationSyntax)]
+            if nodes is None:
+                nodes = self.collect_nodes(root)
+            methods = nodes.methods
             
             for method_decl in methods:
                 # Check if method has HarmonyPatch or Harmony-related attributes
@@ -154,16 +272,16 @@ class RoslynAnalyzer:
                 
                 for attr_list in method_decl.AttributeLists:
                     for attr in attr_list.Attributes:
-                        attr_name = str(attr.Name) if hasattr(attr, "Name") else str(attr)
-                        attr_name_lower = attr_name.lower()
-                        if any(h in attr_name_lower for h in ["harmonypatch", "harmonyprefix", "harmonypostfix", "harmonytranspiler", "harmonyfinalizer"]):
+                        attr_name = str(attr.Name)
+                        simple_name = _simple_attribute_name(attr_name)
+                        if simple_name in _HARMONY_ATTR_NAMES:
                             harmony_attrs.append(attr_name)
-                            if "transpiler" in attr_name_lower:
+                            if simple_name == "HarmonyTranspiler":
                                 is_transpiler = True
                 
                 if harmony_attrs:
                     # Check if method is private
-                    modifiers = [getattr(mod, "ValueText", str(mod)).lower() for mod in method_decl.Modifiers]
+                    modifiers = {mod.ValueText for mod in method_decl.Modifiers}
                     is_private = "private" in modifiers
 
                     # Use the method identifier token for line number (avoids reporting attribute line)
@@ -172,32 +290,29 @@ class RoslynAnalyzer:
                     method_name = str(method_decl.Identifier)
                     
                     if not is_private:
-                        issues.append(Issue(
-                            file_path=file_path,
-                            line_number=method_line,
-                            severity="error",
-                            code="BCS052",
-                            description=f"Method '{method_name}' with Harmony attributes {harmony_attrs} must be private"
+                        raw_issues.append((
+                            method_line,
+                            "error",
+                            "BCS052",
+                            f"Method '{method_name}' with Harmony attributes {harmony_attrs} must be private"
                         ))
                     
                     # If it's a transpiler method, check for method calls to other methods that should be private
                     if is_transpiler and is_private:
-                        callee_issues = self._check_transpiler_method_calls(method_decl, syntax_tree, file_path, root)
-                        issues.extend(callee_issues)
+                        raw_issues.extend(self._check_transpiler_method_calls(method_decl, syntax_tree, methods))
                     
                     # NEW: Check if transpiler method uses ILPatchEngine
                     if is_transpiler:
-                        engine_issues = self._check_harmony_transpiler_uses_ilpatch_engine(method_decl, syntax_tree, file_path, method_name)
-                        issues.extend(engine_issues)
+                        raw_issues.extend(self._check_harmony_transpiler_uses_ilpatch_engine(method_decl, syntax_tree, method_name))
         
         except Exception as e:
             print(f"Error in Roslyn HarmonyPatch method check for {file_path}: {e}")
         
-        return issues
+        return [Issue(file_path, *raw) for raw in raw_issues]
     
-    def _check_harmony_transpiler_uses_ilpatch_engine(self, method: MethodDeclarationSyntax, syntax_tree: SyntaxTree, file_path: str, method_name: str) -> List[Issue]:
+    def _check_harmony_transpiler_uses_ilpatch_engine(self, method: MethodDeclarationSyntax, syntax_tree: SyntaxTree, method_name: str) -> List[RawIssue]:
         """Check if a HarmonyTranspiler method uses ILPatchEngine.ApplyPatches"""
-        issues: List[Issue] = []
+        raw_issues: List[RawIssue] = []
         try:
             # Look for ILPatchEngine.ApplyPatches calls in the method body
             uses_ilpatch_engine = False
@@ -228,33 +343,31 @@ class RoslynAnalyzer:
             # If not using ILPatchEngine, report as warning
             if not uses_ilpatch_engine:
                 method_line = syntax_tree.GetLineSpan(method.Identifier.Span).StartLinePosition.Line + 1
-                issues.append(Issue(
-                    file_path=file_path,
-                    line_number=method_line,
-                    severity="warning", 
-                    code="BCW055",
-                    description=f"HarmonyTranspiler method '{method_name}' should use ILPatchEngine.ApplyPatches for consistent IL patching"
+                raw_issues.append((
+                    method_line,
+                    "warning",
+                    "BCW055",
+                    f"HarmonyTranspiler method '{method_name}' should use ILPatchEngine.ApplyPatches for consistent IL patching"
                 ))
         
         except Exception as e:
             print(f"Error checking ILPatchEngine usage for method {method_name}: {e}")
         
-        return issues
+        return raw_issues
     
-    def _check_transpiler_method_calls(self, transpiler_method: MethodDeclarationSyntax, syntax_tree: SyntaxTree, file_path: str, root: CompilationUnitSyntax) -> List[Issue]:
+    def _check_transpiler_method_calls(self, transpiler_method: MethodDeclarationSyntax, syntax_tree: SyntaxTree, all_methods: List[MethodDeclarationSyntax]) -> List[RawIssue]:
         """Check if transpiler methods call private utility methods"""
-        issues: List[Issue] = []
+        raw_issues: List[RawIssue] = []
         try:
             # Get all method calls in the transpiler method
             invocations = [node for node in transpiler_method.DescendantNodes() if isinstance(node, InvocationExpressionSyntax)]
             
-            # Get all methods in the same file to check their visibility
-            all_methods = [node for node in root.DescendantNodes() if isinstance(node, MethodDeclarationSyntax)]
+            # Check the visibility of all methods in the same file (collected by the caller)
             method_visibility_map = {}
             
             for method in all_methods:
                 method_name = str(method.Identifier)
-                modifiers = [getattr(mod, "ValueText", str(mod)).lower() for mod in method.Modifiers]
+                modifiers = {mod.ValueText for mod in method.Modifiers}
                 is_private = "private" in modifiers
                 is_public = "public" in modifiers
                 is_static = "static" in modifiers
@@ -292,12 +405,11 @@ class RoslynAnalyzer:
                             line_number = syntax_tree.GetLineSpan(invocation.Span).StartLinePosition.Line + 1
                             transpiler_name = str(transpiler_method.Identifier)
                             
-                            issues.append(Issue(
-                                file_path=file_path,
-                                line_number=line_number,
-                                severity="error",
-                                code="BCS053",
-                                description=f"Transpiler method '{transpiler_name}' calls method '{method_name}' which should be private (utility methods can be public static)"
+                            raw_issues.append((
+                                line_number,
+                                "error",
+                                "BCS053",
+                                f"Transpiler method '{transpiler_name}' calls method '{method_name}' which should be private (utility methods can be public static)"
                             ))
                 
                 except Exception:
@@ -307,15 +419,16 @@ class RoslynAnalyzer:
         except Exception as e:
             print(f"Error analyzing transpiler method calls: {e}")
         
-        return issues
+        return raw_issues
 
     # Empty catch blocks
-    def check_empty_catch_blocks(self, file_path: str, syntax_tree: SyntaxTree, root: CompilationUnitSyntax) -> List[Issue]:
+    def check_empty_catch_blocks(self, file_path: str, syntax_tree: SyntaxTree, root: CompilationUnitSyntax, nodes: Optional[SyntaxNodeBuckets] = None) -> List[Issue]:
         """Check for empty catch blocks using Roslyn AST"""
-        issues: List[Issue] = []
+        raw_issues: List[RawIssue] = []
         try:
-            all_nodes = list(root.DescendantNodes())
-            catch_clauses = [node for node in all_nodes if isinstance(node, CatchClauseSyntax)]
+            if nodes is None:
+                nodes = self.collect_nodes(root)
+            catch_clauses = nodes.catch_clauses
             
             for catch_clause in catch_clauses:
                 if catch_clause.Block:
@@ -323,12 +436,11 @@ class RoslynAnalyzer:
                     # Truly empty
                     if stmts.Count == 0:
                         line_number = syntax_tree.GetLineSpan(catch_clause.Span).StartLinePosition.Line + 1
-                        issues.append(Issue(
-                            file_path=file_path,
-                            line_number=line_number,
-                            severity="error",
-                            code="BCS003",
-                            description="Empty catch block - should handle exceptions properly"
+                        raw_issues.append((
+                            line_number,
+                            "error",
+                            "BCS003",
+                            "Empty catch block - should handle exceptions properly"
                         ))
                     # Allow rethrow-only
                     elif stmts.Count == 1 and isinstance(stmts[0], ThrowStatementSyntax):
@@ -336,16 +448,17 @@ class RoslynAnalyzer:
         except Exception as e:
             print(f"Error in Roslyn empty catch check for {file_path}: {e}")
         
-        return issues
+        return [Issue(file_path, *raw) for raw in raw_issues]
 
     # Magic numbers (int + non-int)
-    def check_magic_numbers(self, file_path: str, syntax_tree: SyntaxTree, root: CompilationUnitSyntax) -> List[Issue]:
+    def check_magic_numbers(self, file_path: str, syntax_tree: SyntaxTree, root: CompilationUnitSyntax, nodes: Optional[SyntaxNodeBuckets] = None, lines: Optional[List[str]] = None) -> List[Issue]:
         """Check for magic numbers using Roslyn AST with context awareness"""
-        issues: List[Issue] = []
+        raw_issues: List[RawIssue] = []
         try:
             # Find all numeric literals
-            all_nodes = list(root.DescendantNodes())
-            literals = [node for node in all_nodes if isinstance(node, LiteralExpressionSyntax)]
+            if nodes is None:
+                nodes = self.collect_nodes(root)
+            literals = nodes.literals
             
             for literal in literals:
                 try:
@@ -414,15 +527,14 @@ class RoslynAnalyzer:
                         # Integer-like magic numbers
                         if int_value is not None and abs(int_value) >= 100 and int_value not in self.acceptable_numbers:
                             is_const = self._is_in_const_declaration(literal)
-                            is_guid_related = self._is_guid_related_context(literal, syntax_tree)
+                            is_guid_related = self._is_guid_related_context(literal, syntax_tree, lines)
                             if not is_const and not is_guid_related:
                                 line_number = syntax_tree.GetLineSpan(literal.Span).StartLinePosition.Line + 1
-                                issues.append(Issue(
-                                    file_path=file_path,
-                                    line_number=line_number,
-                                    severity="warning",
-                                    code="BCW012",
-                                    description=f"Magic number '{int_value}' - consider using a named constant"
+                                raw_issues.append((
+                                    line_number,
+                                    "warning",
+                                    "BCW012",
+                                    f"Magic number '{int_value}' - consider using a named constant"
                                 ))
 
                         # Non-integer numeric magic numbers (float/double/decimal)
@@ -440,15 +552,14 @@ class RoslynAnalyzer:
 
                             if abs(float_value) >= min_abs and not approx_in(self.acceptable_float_values, float_value):
                                 is_const = self._is_in_const_declaration(literal)
-                                is_guid_related = self._is_guid_related_context(literal, syntax_tree)
+                                is_guid_related = self._is_guid_related_context(literal, syntax_tree, lines)
                                 if not is_const and not is_guid_related:
                                     line_number = syntax_tree.GetLineSpan(literal.Span).StartLinePosition.Line + 1
-                                    issues.append(Issue(
-                                        file_path=file_path,
-                                        line_number=line_number,
-                                        severity="warning",
-                                        code="BCW012",
-                                        description=f"Magic non-integer number '{float_value}' - consider using a named constant"
+                                    raw_issues.append((
+                                        line_number,
+                                        "warning",
+                                        "BCW012",
+                                        f"Magic non-integer number '{float_value}' - consider using a named constant"
                                     ))
                                 
                 except Exception:
@@ -458,32 +569,39 @@ class RoslynAnalyzer:
         except Exception as e:
             print(f"Error in Roslyn magic numbers check for {file_path}: {e}")
         
-        return issues
+        return [Issue(file_path, *raw) for raw in raw_issues]
     
     def _is_in_const_declaration(self, literal: SyntaxNode) -> bool:
         """Check if literal is part of a const declaration"""
         try:
-            parent = literal.Parent
-            while parent:
-                if hasattr(parent, 'Modifiers'):
-                    modifiers = [getattr(mod, "ValueText", str(mod)).lower() for mod in parent.Modifiers]
-                    if "const" in modifiers:
+            # Only field and local declarations can carry 'const', so let Roslyn find
+            # the nearest of each on the CLR side instead of walking Parent links here
+            declarations = (
+                literal.FirstAncestorOrSelf[FieldDeclarationSyntax](),
+                literal.FirstAncestorOrSelf[LocalDeclarationStatementSyntax](),
+            )
+            for declaration in declarations:
+                if declaration is not None:
+                    if "const" in {mod.ValueText for mod in declaration.Modifiers}:
                         return True
-                parent = getattr(parent, 'Parent', None)
             return False
         except Exception:
             return False
     
-    def _is_guid_related_context(self, literal: SyntaxNode, syntax_tree: SyntaxTree) -> bool:
+    def _is_guid_related_context(self, literal: SyntaxNode, syntax_tree: SyntaxTree, lines: Optional[List[str]] = None) -> bool:
         """Check if literal appears in GUID-related context"""
         try:
             # Get the text around the literal
             span = literal.Span
             line_span = syntax_tree.GetLineSpan(span)
             
-            # Get the full line text
-            source_text = syntax_tree.GetText()
-            line_text = str(source_text.Lines[line_span.StartLinePosition.Line])
+            # Get the full line text (from the already split source when available)
+            line_index = line_span.StartLinePosition.Line
+            if lines is not None:
+                line_text = lines[line_index]
+            else:
+                source_text = syntax_tree.GetText()
+                line_text = str(source_text.Lines[line_index])
             
             # Check for GUID patterns
             line_lower = line_text.lower()
@@ -494,12 +612,13 @@ class RoslynAnalyzer:
             return False
 
     # Cyclomatic complexity
-    def check_cyclomatic_complexity(self, file_path: str, syntax_tree: SyntaxTree, root: CompilationUnitSyntax) -> List[Issue]:
+    def check_cyclomatic_complexity(self, file_path: str, syntax_tree: SyntaxTree, root: CompilationUnitSyntax, nodes: Optional[SyntaxNodeBuckets] = None) -> List[Issue]:
         """Check cyclomatic complexity using Roslyn AST"""
-        issues: List[Issue] = []
+        raw_issues: List[RawIssue] = []
         try:
-            all_nodes = list(root.DescendantNodes())
-            methods = [node for node in all_nodes if isinstance(node, MethodDeclarationSyntax)]
+            if nodes is None:
+                nodes = self.collect_nodes(root)
+            methods = nodes.methods_with_code
             
             for method in methods:
                 complexity = self._calculate_complexity_roslyn(method)
@@ -508,44 +627,26 @@ class RoslynAnalyzer:
                     line_number = syntax_tree.GetLineSpan(method.Span).StartLinePosition.Line + 1
                     method_name = str(method.Identifier)
                     
-                    issues.append(Issue(
-                        file_path=file_path,
-                        line_number=line_number,
-                        severity="warning",
-                        code="BCW040",
-                        description=f"Method '{method_name}' has high complexity ({complexity}) - consider refactoring"
+                    raw_issues.append((
+                        line_number,
+                        "warning",
+                        "BCW040",
+                        f"Method '{method_name}' has high complexity ({complexity}) - consider refactoring"
                     ))
         except Exception as e:
             print(f"Error in Roslyn complexity check for {file_path}: {e}")
         
-        return issues
+        return [Issue(file_path, *raw) for raw in raw_issues]
     
     def _calculate_complexity_roslyn(self, method: MethodDeclarationSyntax) -> int:
         """Calculate cyclomatic complexity from Roslyn AST"""
         try:
             complexity = 1  # Base complexity
-            
-            # Count decision points using specific syntax kinds
-            # Avoid double counting switch + cases: count only cases/default
-            complexity_kinds = [
-                SyntaxKind.IfStatement,
-                SyntaxKind.WhileStatement,
-                SyntaxKind.ForStatement,
-                SyntaxKind.ForEachStatement,
-                SyntaxKind.DoStatement,
-                SyntaxKind.CatchClause,
-                SyntaxKind.ConditionalExpression,  # ? :
-                SyntaxKind.CaseSwitchLabel,
-                SyntaxKind.DefaultSwitchLabel,
-            ]
+            complexity_raw_kinds = self.complexity_raw_kinds
             
             for node in method.DescendantNodes():
-                node_kind = node.Kind()
-                if any(node_kind == kind for kind in complexity_kinds):
-                    complexity += 1
-                
-                # Count logical operators
-                if node_kind == SyntaxKind.LogicalAndExpression or node_kind == SyntaxKind.LogicalOrExpression:
+                # One CLR property read per node; no enum boxing and no per-kind comparisons
+                if node.RawKind in complexity_raw_kinds:
                     complexity += 1
             
             return complexity
@@ -553,126 +654,115 @@ class RoslynAnalyzer:
             return 1  # Fallback to base complexity
 
     # Excessive nesting (Roslyn)
-    def check_excessive_nesting(self, file_path: str, syntax_tree: SyntaxTree, root: CompilationUnitSyntax, max_nesting: int = 5) -> List[Issue]:
+    def check_excessive_nesting(self, file_path: str, syntax_tree: SyntaxTree, root: CompilationUnitSyntax, max_nesting: int = 5, nodes: Optional[SyntaxNodeBuckets] = None) -> List[Issue]:
         """
         Check for excessive nesting depth per method using Roslyn AST.
         Counts nesting introduced by: if/else, for/foreach/while/do, switch, try/catch/finally, using, lock, fixed.
         Threshold is max_nesting (default 5).
         """
-        issues: List[Issue] = []
+        raw_issues: List[RawIssue] = []
         try:
-            all_nodes = list(root.DescendantNodes())
-            methods = [node for node in all_nodes if isinstance(node, MethodDeclarationSyntax)]
+            if nodes is None:
+                nodes = self.collect_nodes(root)
+            methods = nodes.methods_with_body
 
             for method in methods:
-                max_depth = 0
-
                 # Handle block-bodied methods
-                if getattr(method, "Body", None):
-                    block: BlockSyntax = method.Body
-                    for stmt in block.Statements:
-                        max_depth = max(max_depth, self._max_nesting_in_statement(stmt, 0))
+                max_depth = self._max_nesting_iter(method)
 
                 # Expression-bodied methods have no nesting depth
                 if max_depth > max_nesting:
                     method_name = str(method.Identifier)
                     line_number = syntax_tree.GetLineSpan(method.Span).StartLinePosition.Line + 1
-                    issues.append(Issue(
-                        file_path=file_path,
-                        line_number=line_number,
-                        severity="warning",
-                        code="BCW010",
-                        description=f"Excessive nesting level ({max_depth} > {max_nesting}) in method '{method_name}' - consider refactoring"
+                    raw_issues.append((
+                        line_number,
+                        "warning",
+                        "BCW010",
+                        f"Excessive nesting level ({max_depth} > {max_nesting}) in method '{method_name}' - consider refactoring"
                     ))
         except Exception as e:
             print(f"Error in Roslyn excessive nesting check for {file_path}: {e}")
 
-        return issues
-
-    def _max_nesting_in_block(self, block: BlockSyntax, depth: int) -> int:
-        """Compute maximum nesting depth inside a block without increasing depth for the block itself."""
-        if block is None:
-            return depth
-        max_d = depth
-        try:
-            for stmt in block.Statements:
-                max_d = max(max_d, self._max_nesting_in_statement(stmt, depth))
-        except Exception:
-            pass
-        return max_d
+        return [Issue(file_path, *raw) for raw in raw_issues]
 
-    def _max_nesting_in_statement(self, stmt: SyntaxNode, depth: int) -> int:
+    def _max_nesting_iter(self, method: MethodDeclarationSyntax) -> int:
         """
-        Recursively compute nesting depth introduced by control statements.
+        Compute maximum nesting depth introduced by control statements, using an explicit (node, depth) stack.
         We increment depth when entering a control construct; we do not increment again for the child block itself to avoid double counting.
         """
-        if stmt is None:
-            return depth
-
-        try:
-            # if / else
-            if isinstance(stmt, IfStatementSyntax):
-                d = depth + 1
-                max_d = self._max_nesting_in_statement(stmt.Statement, d)
-                # Else can be another if (else-if) or a block/statement
-                if getattr(stmt, "Else", None):
-                    else_stmt = stmt.Else.Statement
-                    max_d = max(max_d, self._max_nesting_in_statement(else_stmt, d))
-                return max_d
-
-            # loops
-            if isinstance(stmt, (ForStatementSyntax, ForEachStatementSyntax, WhileStatementSyntax, DoStatementSyntax)):
-                d = depth + 1
-                inner = getattr(stmt, "Statement", None)
-                return self._max_nesting_in_statement(inner, d)
-
-            # switch
-            if isinstance(stmt, SwitchStatementSyntax):
-                d = depth + 1
-                max_d = d
-                for section in stmt.Sections:
-                    for s in section.Statements:
-                        max_d = max(max_d, self._max_nesting_in_statement(s, d))
-                return max_d
-
-            # try/catch/finally
-            if isinstance(stmt, TryStatementSyntax):
-                d = depth + 1
-                max_d = self._max_nesting_in_block(stmt.Block, d)
-                for c in stmt.Catches:
-                    max_d = max(max_d, self._max_nesting_in_block(c.Block, d))
-                if getattr(stmt, "Finally", None):
-                    max_d = max(max_d, self._max_nesting_in_block(stmt.Finally.Block, d))
-                return max_d
-
-            # using / lock / fixed
-            if isinstance(stmt, (UsingStatementSyntax, LockStatementSyntax, FixedStatementSyntax)):
-                d = depth + 1
-                inner = getattr(stmt, "Statement", None)
-                # Using/Lock/Fixed can have either a Block or a single Statement
-                if isinstance(inner, BlockSyntax):
-                    return self._max_nesting_in_block(inner, d)
-                return self._max_nesting_in_statement(inner, d)
-
-            # plain block (does not on its own increase nesting; enclosing control already did)
-            if isinstance(stmt, BlockSyntax):
-                return self._max_nesting_in_block(stmt, depth)
-
-            # Other statements: compute over child nodes that are statements/blocks
-            max_d = depth
-            for child in stmt.ChildNodes():
-                if isinstance(child, (BlockSyntax, IfStatementSyntax, ForStatementSyntax, ForEachStatementSyntax, WhileStatementSyntax,
-                                      DoStatementSyntax, SwitchStatementSyntax, TryStatementSyntax, UsingStatementSyntax,
-                                      LockStatementSyntax, FixedStatementSyntax)):
-                    max_d = max(max_d, self._max_nesting_in_statement(child, depth))
-            return max_d
-
-        except Exception:
-            # If anything goes wrong, do not crash analysis; return current depth
-            return depth
-
+        body = getattr(method, "Body", None)
+        if body is None:
+            return 0
+
+        control_raw_kinds = self.nesting_control_raw_kinds
+        if_kind = self.if_raw_kind
+        switch_kind = self.switch_raw_kind
+        try_kind = self.try_raw_kind
+        block_kind = self.block_raw_kind
+
+        max_depth = 0
+        stack = [(stmt, 0) for stmt in body.Statements]
+        while stack:
+            node, depth = stack.pop()
+            if node is None:
+                continue
+
+            # Children are gathered first and only pushed once the node is fully read, so a node
+            # that raises is skipped along with its subtree and the rest of the method is still walked
+            children = []
+            try:
+                kind = node.RawKind
+                if kind in control_raw_kinds:
+                    depth += 1
+
+                # if / else (else can be another if (else-if) or a block/statement)
+                if kind == if_kind:
+                    children.append(node.Statement)
+                    if node.Else is not None:
+                        children.append(node.Else.Statement)
+
+                # switch
+                elif kind == switch_kind:
+                    for section in node.Sections:
+                        children.extend(section.Statements)
+
+                # try/catch/finally
+                elif kind == try_kind:
+                    children.append(node.Block)
+                    for c in node.Catches:
+                        children.append(c.Block)
+                    if node.Finally is not None:
+                        children.append(node.Finally.Block)
+
+                # loops and using / lock / fixed (a Block or a single Statement)
+                elif kind in control_raw_kinds:
+                    children.append(node.Statement)
+
+                # plain block (does not on its own increase nesting; enclosing control already did)
+                elif kind == block_kind:
+                    children.extend(node.Statements)
+
+                # Other statements: descend into child nodes that are statements/blocks
+                else:
+                    for child in node.ChildNodes():
+                        child_kind = child.RawKind
+                        if child_kind == block_kind or child_kind in control_raw_kinds:
+                            children.append(child)
+            except Exception:
+                # If anything goes wrong, do not crash analysis; skip this node as if it added no nesting
+                continue
+
+            if depth > max_depth:
+                max_depth = depth
+            stack.extend((child, depth) for child in children)
+
+        return max_depth
 
 # Module-level convenience function
 def is_roslyn_available() -> bool:
     """Check if Roslyn is available for enhanced parsing"""
-    return ROSLYN_AVAILABLE
\ No newline at end of file
+    return ROSLYN_AVAILABLE
+
+def roslyn_status_message() -> str:
+    """Describe the outcome of the Roslyn import attempt"""
+    return ROSLYN_STATUS_MESSAGE
\ No newline at end of file
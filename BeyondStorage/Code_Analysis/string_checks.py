@@ -3,58 +3,128 @@ String-based code analysis checks
 """
 
 import re
-from typing import List
+from typing import Dict, List, Optional
 from models import Issue
-from utils import clean_file_path, extract_method_name, is_guid_context
+from utils import clean_file_path, extract_method_name, has_guid_keyword, is_guid_pattern_near, line_start_offsets, line_number_at
+
+# Try to import pyahocorasick for single-pass multi-pattern forbidden string matching
+AHOCORASICK_AVAILABLE = False
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Patterns are compiled once at import time instead of being looked up in re's cache per line
+_METHOD_RE = re.compile(r'(public|private|protected|internal|static).*\s+\w+\s*\([^)]*\)\s*\{?')
+# Leading whitespace; \s is the same Unicode whitespace set that str.lstrip() removes
+_LEADING_WHITESPACE_RE = re.compile(r'\s*')
+_MAGIC_NUMBER_RE = re.compile(r'\b(\d{3,})\b')
+_TODO_PREFIX_RE = re.compile(r'^todo\s*:?\s*', re.IGNORECASE)
+# Case-insensitive 'todo' anywhere; ASCII folding matches what str.lower() can produce for these letters
+_TODO_ANY_CASE_RE = re.compile(r'todo', re.IGNORECASE | re.ASCII)
+# Same for 'const' and 'string': searched case-insensitively in place instead of lower-casing a copy of the line
+_CONST_ANY_CASE_RE = re.compile(r'const', re.IGNORECASE | re.ASCII)
+_STRING_ANY_CASE_RE = re.compile(r'string', re.IGNORECASE | re.ASCII)
+_NULL_CHECK_RE = re.compile(r'\w+\s*!=\s*null\s*&&\s*\w+\.\w+')
+# Patterns that serve the same check are joined into one alternation, so a line costs one search
+_STRING_CONCAT_RE = re.compile(r'"\s*\+\s*\w+\s*\+\s*"|"\w*"\s*\+\s*\w+')
+_LOOP_START_RE = re.compile(r'\b(for|foreach|while)\s*\(')
+_STRING_APPEND_RE = re.compile(r'"\s*\+|string\s*\+|\w+\s*\+=\s*"|\w+\s*\+=\s*\w+\s*\+\s*"')
+_DISPOSABLE_TYPES = ('FileStream', 'StreamWriter', 'StreamReader', 'SqlConnection', 'HttpClient')
+_NEW_DISPOSABLE_RE = re.compile(r'\bnew\s+(' + '|'.join(_DISPOSABLE_TYPES) + r')\b')
+_COUNT_GREATER_THAN_ZERO_RE = re.compile(r'\.Count\(\)\s*>\s*0')
+_METHOD_SIGNATURE_RE = re.compile(r'(public|private|protected|internal).*\w+\s*\([^)]*\)')
+# Decision points: whole-word C# keywords (case-sensitive, so 'diff' or 'Format' never count) and operators
+_COMPLEXITY_RE = re.compile(r'\b(?:else\s+if|if|while|foreach|for|switch|case|catch)\b|&&|\|\||\?')
 
 
 class StringBasedChecker:
     """String-based code quality checker for C# files"""
     
-    def check_forbidden_strings(self, file_path: str, content: str, forbidden_strings: dict) -> List[Issue]:
+    def __init__(self):
+        # Aho-Corasick automaton over the forbidden strings, rebuilt only when the patterns change
+        self._forbidden_automaton = None
+        self._forbidden_automaton_patterns = None
+    
+    def check_forbidden_strings(self, file_path: str, content: str, forbidden_strings: dict, lines: Optional[List[str]] = None) -> List[Issue]:
         """Check for strings that should not exist in the code"""
         issues = []
-        lines = content.split('\n')
+        cleaned_path = clean_file_path(file_path)
+        patterns = list(forbidden_strings)
+        if lines is None:
+            lines = content.split('\n')
+        line_starts = line_start_offsets(lines)
 
         # Should always be a case-sensitive check
-        for forbidden_string, (severity, code, description) in forbidden_strings.items():
-            for line_num, line in enumerate(lines, 1):
-                if forbidden_string in line:
-                    issues.append(Issue(
-                        file_path=clean_file_path(file_path),
-                        line_number=line_num,
-                        severity=severity,
-                        code=code,
-                        description=description
-                    ))
+        # Content is scanned as a whole and hit offsets are mapped back to line numbers;
+        # each pattern is still reported at most once per line, in pattern then line order
+        if AHOCORASICK_AVAILABLE and all(patterns):
+            pattern_lines = self._find_forbidden_lines_automaton(patterns, content, line_starts)
+        else:
+            pattern_lines = [self._find_forbidden_lines(pattern, content, line_starts) for pattern in patterns]
+
+        for forbidden_string, line_numbers in zip(patterns, pattern_lines):
+            severity, code, description = forbidden_strings[forbidden_string]
+            for line_num in line_numbers:
+                issues.append(Issue(
+                    file_path=cleaned_path,
+                    line_number=line_num,
+                    severity=severity,
+                    code=code,
+                    description=description
+                ))
         
         return issues
     
-    def check_excessive_nesting(self, file_path: str, content: str) -> List[Issue]:
-        """Check for excessive nesting levels (more than 4 levels) - WARNING"""
-        issues = []
-        lines = content.split('\n')
-        max_nesting = 4
+    def _find_forbidden_lines(self, pattern: str, content: str, line_starts: List[int]) -> List[int]:
+        """Line numbers containing pattern, using str.find over the whole content"""
+        line_numbers = []
+        # A pattern spanning a line break can never be found within a single line
+        if '\n' in pattern:
+            return line_numbers
         
-        for line_num, line in enumerate(lines, 1):
-            stripped = line.strip()
-            if stripped and not stripped.startswith('//') and not stripped.startswith('*'):
-                indent_level = (len(line) - len(line.lstrip())) // 4
-                if indent_level > max_nesting and '{' in line:
-                    issues.append(Issue(
-                        file_path=clean_file_path(file_path),
-                        line_number=line_num,
-                        severity="warning",
-                        code="BCW010",
-                        description=f"Excessive nesting level ({indent_level} > {max_nesting}) - consider refactoring"
-                    ))
+        pos = content.find(pattern)
+        while pos != -1:
+            line_num = line_number_at(line_starts, pos)
+            line_numbers.append(line_num)
+            if line_num >= len(line_starts):
+                break
+            # Resume at the start of the next line; one hit per line is enough
+            pos = content.find(pattern, line_starts[line_num])
+        return line_numbers
+    
+    def _find_forbidden_lines_automaton(self, patterns: List[str], content: str, line_starts: List[int]) -> List[List[int]]:
+        """Line numbers containing each pattern, from one Aho-Corasick pass over the content"""
+        pattern_lines = [[] for _ in patterns]
         
-        return issues
+        if self._forbidden_automaton_patterns != patterns:
+            automaton = ahocorasick.Automaton()
+            for pattern_index, pattern in enumerate(patterns):
+                # A pattern spanning a line break can never be found within a single line
+                if '\n' not in pattern:
+                    automaton.add_word(pattern, (pattern_index, len(pattern)))
+            automaton.make_automaton()
+            self._forbidden_automaton = automaton if len(automaton) else None
+            self._forbidden_automaton_patterns = patterns
+        
+        if self._forbidden_automaton is None:
+            return pattern_lines
+        
+        # Hits arrive in end offset order, so each pattern's line numbers are non-decreasing
+        for end_index, (pattern_index, length) in self._forbidden_automaton.iter(content):
+            line_num = line_number_at(line_starts, end_index - length + 1)
+            line_numbers = pattern_lines[pattern_index]
+            if not line_numbers or line_numbers[-1] != line_num:
+                line_numbers.append(line_num)
+        return pattern_lines
     
-    def check_long_methods(self, file_path: str, content: str) -> List[Issue]:
+    def check_long_methods(self, file_path: str, content: str, lines: Optional[List[str]] = None) -> List[Issue]:
         """Check for methods that are too long (more than 80 lines) - WARNING"""
         issues = []
-        lines = content.split('\n')
+        cleaned_path = clean_file_path(file_path)
+        if lines is None:
+            lines = content.split('\n')
         max_method_length = 80
         
         in_method = False
@@ -68,8 +138,7 @@ class StringBasedChecker:
             if not stripped or stripped.startswith('//') or stripped.startswith('*'):
                 continue
             
-            method_pattern = r'(public|private|protected|internal|static).*\s+\w+\s*\([^)]*\)\s*\{?'
-            if re.search(method_pattern, stripped) and not in_method:
+            if _METHOD_RE.search(stripped) and not in_method:
                 in_method = True
                 method_start_line = line_num
                 method_name = extract_method_name(stripped)
@@ -83,7 +152,7 @@ class StringBasedChecker:
                     method_length = line_num - method_start_line + 1
                     if method_length > max_method_length:
                         issues.append(Issue(
-                            file_path=clean_file_path(file_path),
+                            file_path=cleaned_path,
                             line_number=method_start_line,
                             severity="warning",
                             code="BCW011",
@@ -93,251 +162,104 @@ class StringBasedChecker:
         
         return issues
     
-    def check_magic_numbers(self, file_path: str, content: str) -> List[Issue]:
-        """Check for magic numbers (hardcoded numbers except common ones) - WARNING"""
-        issues = []
-        lines = content.split('\n')
+    def run_line_checks(self, file_path: str, content: str, lines: Optional[List[str]] = None,
+                        stripped_lines: Optional[List[str]] = None) -> Dict[str, List[Issue]]:
+        """
+        Run the always-on line-based checks in a single pass over the file.
+        Returns issues keyed by check name, in reporting order.
+        """
+        cleaned_path = clean_file_path(file_path)
+        todo_issues = []
+        null_check_issues = []
+        disposable_issues = []
+        interpolation_issues = []
+        string_in_loop_issues = []
+        linq_issues = []
         
-        acceptable_numbers = {0, 1, 2, -1, 100, 1000}
+        results = {
+            "todo_comments": todo_issues,
+            "null_checks": null_check_issues,
+            "disposable_usage": disposable_issues,
+            "string_interpolation": interpolation_issues,
+            "string_in_loops": string_in_loop_issues,
+            "linq_performance": linq_issues,
+        }
         
-        for line_num, line in enumerate(lines, 1):
-            stripped = line.strip()
-            
-            if stripped.startswith('//') or stripped.startswith('*'):
-                continue
-            
-            number_pattern = r'\b(\d{3,})\b'
-            matches = re.finditer(number_pattern, line)
-            
-            for match in matches:
-                number = int(match.group(1))
-                if number not in acceptable_numbers:
-                    if 'const' not in line.lower():
-                        # Check if this number is part of a GUID
-                        if not is_guid_context(line, match.start(), match.end()):
-                            issues.append(Issue(
-                                file_path=clean_file_path(file_path),
-                                line_number=line_num,
-                                severity="warning",
-                                code="BCW012",
-                                description=f"Magic number '{number}' - consider using a named constant"
-                            ))
+        in_loop = False
         
-        return issues
-    
-    def check_todo_comments(self, file_path: str, content: str) -> List[Issue]:
-        """Check for TODO comments that should be addressed - WARNING"""
-        issues = []
-        lines = content.split('\n')
+        # Per-file prescan: a check whose required text appears nowhere in the file cannot fire
+        # on any line, so it is switched off up front (and the loop skipped if nothing is left)
+        scan_todo = ('//' in content or '/*' in content) and _TODO_ANY_CASE_RE.search(content) is not None
+        scan_null_checks = '!=' in content and 'null' in content
+        scan_disposables = 'new' in content
+        scan_interpolation = '"' in content and '+' in content
+        scan_count = '.Count()' in content
+        scan_to_list = '.ToList()' in content
+        scan_loops = '+=' in content
+        if not (scan_todo or scan_null_checks or scan_disposables or scan_interpolation
+                or scan_count or scan_to_list or scan_loops):
+            return results
         
-        for line_num, line in enumerate(lines, 1):
-            stripped = line.strip().lower()
-            if 'todo' in stripped and ('//' in line or '/*' in line):
-                # Extract the actual comment text
-                comment_text = line.strip()
-                
-                # Remove common comment prefixes
-                if '//' in comment_text:
-                    comment_text = comment_text.split('//', 1)[1].strip()
-                elif '/*' in comment_text:
-                    comment_text = comment_text.split('/*', 1)[1].strip()
-                    if '*/' in comment_text:
-                        comment_text = comment_text.split('*/', 1)[0].strip()
-                
-                # Check if the comment already starts with "todo" (case-insensitive)
-                if comment_text.lower().startswith('todo'):
-                    # Remove the existing "todo" prefix and any following colon/whitespace
-                    # This handles: "TODO:", "todo:", "Todo ", "TODO ", etc.
-                    comment_without_todo = re.sub(r'^todo\s*:?\s*', '', comment_text, flags=re.IGNORECASE)
-                    
-                    # Always start with "TODO: " in uppercase
-                    if len(comment_without_todo) > 97:  # 100 - len("TODO: ") = 97
-                        description = f"TODO: {comment_without_todo[:97]}..."
-                    else:
-                        description = f"TODO: {comment_without_todo}"
-                else:
-                    # Prepend "TODO: " if it doesn't already start with it
-                    if len(comment_text) > 94:  # 100 - len("TODO: ") = 94
-                        description = f"TODO: {comment_text[:94]}..."
-                    else:
-                        description = f"TODO: {comment_text}"
-                
-                issues.append(Issue(
-                    file_path=clean_file_path(file_path),
+        if lines is None:
+            lines = content.split('\n')
+        if stripped_lines is None:
+            stripped_lines = [line.strip() for line in lines]
+        
+        for line_num, (line, stripped) in enumerate(zip(lines, stripped_lines), 1):
+            # TODO comments (also reported on comment-only lines)
+            if scan_todo and ('//' in line or '/*' in line) and _TODO_ANY_CASE_RE.search(line):
+                todo_issues.append(Issue(
+                    file_path=cleaned_path,
                     line_number=line_num,
                     severity="warning",
                     code="BCW013",
-                    description=description
+                    description=self._todo_description(line)
                 ))
-        
-        return issues
-    
-    def check_empty_catch_blocks(self, file_path: str, content: str) -> List[Issue]:
-        """Check for empty catch blocks - ERROR"""
-        issues = []
-        lines = content.split('\n')
-        
-        in_catch = False
-        catch_line = 0
-        brace_count = 0
-        has_content = False
-        
-        for line_num, line in enumerate(lines, 1):
-            stripped = line.strip()
-            
-            if not stripped or stripped.startswith('//'):
-                continue
-            
-            if 'catch' in stripped and '{' in stripped:
-                in_catch = True
-                catch_line = line_num
-                brace_count = stripped.count('{') - stripped.count('}')
-                has_content = False
-                continue
             
-            if in_catch:
-                brace_count += stripped.count('{') - stripped.count('}')
-                
-                if stripped and not stripped.startswith('//'):
-                    has_content = True
-                
-                if brace_count <= 0:
-                    if not has_content:
-                        issues.append(Issue(
-                            file_path=clean_file_path(file_path),
-                            line_number=catch_line,
-                            severity="error",
-                            code="BCS003",
-                            description="Empty catch block found - should handle exceptions properly"
-                        ))
-                    in_catch = False
-        
-        return issues
-    
-    def check_null_checks(self, file_path: str, content: str) -> List[Issue]:
-        """Check for old-style null checks - WARNING"""
-        issues = []
-        lines = content.split('\n')
-        
-        for line_num, line in enumerate(lines, 1):
-            stripped = line.strip()
             if stripped.startswith('//'):
                 continue
             
+            # Each regex below is gated on literal text it cannot match without, so the
+            # regex engine only runs on the few lines that could possibly match
+            
             # Look for old-style null checks
-            if re.search(r'\w+\s*!=\s*null\s*&&\s*\w+\.\w+', line):
-                issues.append(Issue(
-                    file_path=clean_file_path(file_path),
+            if scan_null_checks and '!=' in line and 'null' in line and _NULL_CHECK_RE.search(line):
+                null_check_issues.append(Issue(
+                    file_path=cleaned_path,
                     line_number=line_num,
                     severity="warning",
                     code="BCW022", 
                     description="Consider using null-conditional operator (?.) instead of explicit null check"
                 ))
-        
-        return issues
-
-    def check_disposable_usage(self, file_path: str, content: str) -> List[Issue]:
-        """Check for IDisposable objects not in using statements - ERROR"""
-        issues = []
-        lines = content.split('\n')
-        
-        disposable_types = ['FileStream', 'StreamWriter', 'StreamReader', 'SqlConnection', 'HttpClient']
-        
-        for line_num, line in enumerate(lines, 1):
-            stripped = line.strip()
-            if stripped.startswith('//'):
-                continue
-                
-            for disposable_type in disposable_types:
-                if f'new {disposable_type}' in line and 'using' not in line:
-                    issues.append(Issue(
-                        file_path=clean_file_path(file_path),
-                        line_number=line_num,
-                        severity="error",
-                        code="BCS010",
-                        description=f"IDisposable type '{disposable_type}' should be wrapped in using statement"
-                    ))
-        
-        return issues
-
-    def check_string_interpolation(self, file_path: str, content: str) -> List[Issue]:
-        """Check for string concatenation that should use interpolation - WARNING"""
-        issues = []
-        lines = content.split('\n')
-        
-        for line_num, line in enumerate(lines, 1):
-            stripped = line.strip()
-            if stripped.startswith('//') or '"' not in stripped:
-                continue
-                
+            
+            # IDisposable objects not in using statements
+            if scan_disposables and 'new' in line and 'using' not in line:
+                # One search for all types; each type found is still reported once, in type order
+                found_types = {match.group(1) for match in _NEW_DISPOSABLE_RE.finditer(line)}
+                for disposable_type in _DISPOSABLE_TYPES:
+                    if disposable_type in found_types:
+                        disposable_issues.append(Issue(
+                            file_path=cleaned_path,
+                            line_number=line_num,
+                            severity="error",
+                            code="BCS010",
+                            description=f"IDisposable type '{disposable_type}' should be wrapped in using statement"
+                        ))
+            
             # Look for string concatenation patterns
-            if re.search(r'"\s*\+\s*\w+\s*\+\s*"', line) or re.search(r'"\w*"\s*\+\s*\w+', line):
-                issues.append(Issue(
-                    file_path=clean_file_path(file_path),
+            if scan_interpolation and '"' in stripped and '+' in line and _STRING_CONCAT_RE.search(line):
+                interpolation_issues.append(Issue(
+                    file_path=cleaned_path,
                     line_number=line_num,
                     severity="warning", 
                     code="BCW021",
                     description="Consider using string interpolation ($\"...\") instead of concatenation"
                 ))
-        
-        return issues
-
-    def check_string_in_loops(self, file_path: str, content: str) -> List[Issue]:
-        """Check for string concatenation in loops - WARNING"""
-        issues = []
-        lines = content.split('\n')
-        
-        in_loop = False
-        loop_start = 0
-        
-        for line_num, line in enumerate(lines, 1):
-            stripped = line.strip()
-            if stripped.startswith('//'):
-                continue
-                
-            # Detect loop starts
-            if re.search(r'\b(for|foreach|while)\s*\(', line):
-                in_loop = True
-                loop_start = line_num
-                continue
-                
-            if in_loop and '{' in line:
-                continue
             
-            if in_loop and '}' in line:
-                in_loop = False
-                continue
-            
-            # Check for string concatenation in loops - be more specific about string operations
-            if in_loop and '+=' in line:
-                # Only flag if we can determine it's actually string concatenation
-                if ('string' in line.lower() or 
-                    re.search(r'"\s*\+|string\s*\+|\w+\s*\+=\s*"', line) or
-                    re.search(r'\w+\s*\+=\s*\w+\s*\+\s*"', line)):
-                    issues.append(Issue(
-                        file_path=clean_file_path(file_path),
-                        line_number=line_num,
-                        severity="warning",
-                        code="BCW025",
-                        description="String concatenation in loop - consider using StringBuilder"
-                    ))
-        
-        return issues
-
-    def check_linq_performance(self, file_path: str, content: str) -> List[Issue]:
-        """Check for potentially inefficient LINQ usage - WARNING"""
-        issues = []
-        lines = content.split('\n')
-        
-        for line_num, line in enumerate(lines, 1):
-            stripped = line.strip()
-            if stripped.startswith('//'):
-                continue
-                
             # Check for Count() vs Any()
-            if re.search(r'\.Count\(\)\s*>\s*0', line):
-                issues.append(Issue(
-                    file_path=clean_file_path(file_path),
+            if scan_count and '.Count()' in line and _COUNT_GREATER_THAN_ZERO_RE.search(line):
+                linq_issues.append(Issue(
+                    file_path=cleaned_path,
                     line_number=line_num,
                     severity="warning",
                     code="BCW026",
@@ -345,39 +267,218 @@ class StringBasedChecker:
                 ))
                 
             # Check for multiple enumerations
-            if line.count('.ToList()') > 1:
-                issues.append(Issue(
-                    file_path=clean_file_path(file_path),
+            if scan_to_list and line.count('.ToList()') > 1:
+                linq_issues.append(Issue(
+                    file_path=cleaned_path,
                     line_number=line_num,
                     severity="warning", 
                     code="BCW027",
                     description="Multiple ToList() calls may cause multiple enumerations"
                 ))
+            
+            # String concatenation in loops: detect loop starts, then track until the loop closes
+            # (without any '+=' in the file no loop is ever entered)
+            if scan_loops and ('for' in line or 'while' in line) and _LOOP_START_RE.search(line):
+                in_loop = True
+            elif in_loop and '{' in line:
+                pass
+            elif in_loop and '}' in line:
+                in_loop = False
+            # Check for string concatenation in loops - be more specific about string operations
+            elif in_loop and '+=' in line:
+                # Only flag if we can determine it's actually string concatenation
+                if (_STRING_ANY_CASE_RE.search(line) or 
+                    _STRING_APPEND_RE.search(line)):
+                    string_in_loop_issues.append(Issue(
+                        file_path=cleaned_path,
+                        line_number=line_num,
+                        severity="warning",
+                        code="BCW025",
+                        description="String concatenation in loop - consider using StringBuilder"
+                    ))
+        
+        return results
+    
+    def _todo_description(self, line: str) -> str:
+        """Build the issue description for a line containing a TODO comment"""
+        # Extract the actual comment text by slicing at the marker offsets instead of
+        # stripping and splitting copies of the line; '//' takes precedence over '/*'
+        comment_start = line.find('//')
+        if comment_start >= 0:
+            comment_text = line[comment_start + 2:].strip()
+        else:
+            comment_start = line.find('/*')
+            if comment_start >= 0:
+                comment_end = line.find('*/', comment_start + 2)
+                comment_text = line[comment_start + 2:comment_end if comment_end >= 0 else len(line)].strip()
+            else:
+                comment_text = line.strip()
+        
+        # Check if the comment already starts with "todo" (case-insensitive)
+        todo_prefix = _TODO_PREFIX_RE.match(comment_text)
+        if todo_prefix:
+            # Remove the existing "todo" prefix and any following colon/whitespace
+            # This handles: "TODO:", "todo:", "Todo ", "TODO ", etc.
+            comment_without_todo = comment_text[todo_prefix.end():]
+            
+            # Always start with "TODO: " in uppercase
+            if len(comment_without_todo) > 97:  # 100 - len("TODO: ") = 97
+                return f"TODO: {comment_without_todo[:97]}..."
+            return f"TODO: {comment_without_todo}"
+        
+        # Prepend "TODO: " if it doesn't already start with it
+        if len(comment_text) > 94:  # 100 - len("TODO: ") = 94
+            return f"TODO: {comment_text[:94]}..."
+        return f"TODO: {comment_text}"
+    
+    def check_todo_comments(self, file_path: str, content: str, lines: Optional[List[str]] = None) -> List[Issue]:
+        """Check for TODO comments that should be addressed - WARNING"""
+        return self.run_line_checks(file_path, content, lines)["todo_comments"]
+    
+    def check_null_checks(self, file_path: str, content: str, lines: Optional[List[str]] = None) -> List[Issue]:
+        """Check for old-style null checks - WARNING"""
+        return self.run_line_checks(file_path, content, lines)["null_checks"]
 
-        return issues
+    def check_disposable_usage(self, file_path: str, content: str, lines: Optional[List[str]] = None) -> List[Issue]:
+        """Check for IDisposable objects not in using statements - ERROR"""
+        return self.run_line_checks(file_path, content, lines)["disposable_usage"]
 
-    def check_cyclomatic_complexity(self, file_path: str, content: str) -> List[Issue]:
-        """Check for high cyclomatic complexity - WARNING"""
-        issues = []
-        lines = content.split('\n')
+    def check_string_interpolation(self, file_path: str, content: str, lines: Optional[List[str]] = None) -> List[Issue]:
+        """Check for string concatenation that should use interpolation - WARNING"""
+        return self.run_line_checks(file_path, content, lines)["string_interpolation"]
+
+    def check_string_in_loops(self, file_path: str, content: str, lines: Optional[List[str]] = None) -> List[Issue]:
+        """Check for string concatenation in loops - WARNING"""
+        return self.run_line_checks(file_path, content, lines)["string_in_loops"]
+
+    def check_linq_performance(self, file_path: str, content: str, lines: Optional[List[str]] = None) -> List[Issue]:
+        """Check for potentially inefficient LINQ usage - WARNING"""
+        return self.run_line_checks(file_path, content, lines)["linq_performance"]
+
+    def run_fallback_checks(self, file_path: str, content: str, lines: Optional[List[str]] = None,
+                            stripped_lines: Optional[List[str]] = None) -> Dict[str, List[Issue]]:
+        """
+        Run the string-based fallbacks for the Roslyn checks (empty catch blocks, magic numbers,
+        cyclomatic complexity, excessive nesting) in a single pass over the file.
+        Each line's braces are counted once and feed both brace-tracking state machines.
+        Returns issues keyed by check name, in reporting order.
+        """
+        cleaned_path = clean_file_path(file_path)
+        empty_catch_issues = []
+        magic_number_issues = []
+        complexity_issues = []
+        nesting_issues = []
+        
+        results = {
+            "empty_catch_blocks": empty_catch_issues,
+            "magic_numbers": magic_number_issues,
+            "cyclomatic_complexity": complexity_issues,
+            "excessive_nesting": nesting_issues,
+        }
+        
+        # Per-file prescan: every check except magic numbers starts from a line that opens a brace,
+        # and a magic number has to appear somewhere in the file before any line can report one
+        scan_braces = '{' in content
+        scan_magic_numbers = _MAGIC_NUMBER_RE.search(content) is not None
+        if not (scan_braces or scan_magic_numbers):
+            return results
         
+        if lines is None:
+            lines = content.split('\n')
+        if stripped_lines is None:
+            stripped_lines = [line.strip() for line in lines]
+        
+        # Magic number settings
+        acceptable_numbers = {0, 1, 2, -1, 100, 1000}
+        
+        # Excessive nesting settings: a reportable line opens a brace and is indented by more
+        # than max_nesting levels of 4, so other lines are rejected by C-level tests first
+        max_nesting = 4
+        min_indent = (max_nesting + 1) * 4
+        
+        # Empty catch block state
+        in_catch = False
+        catch_line = 0
+        brace_count = 0
+        has_content = False
+        
+        # Cyclomatic complexity state
         in_method = False
         method_start = 0
         complexity = 1  # Base complexity
         method_name = ""
         
-        complexity_keywords = ['if', 'else if', 'while', 'for', 'foreach', 'switch', 'case', 'catch', '&&', '||', '?']
-        
-        for line_num, line in enumerate(lines, 1):
-            stripped = line.strip()
-            if stripped.startswith('//'):
+        for line_num, (line, stripped) in enumerate(zip(lines, stripped_lines), 1):
+            # No check does anything with blank or comment lines
+            if not stripped or stripped.startswith('//'):
                 continue
+            
+            open_braces = stripped.count('{')
+            close_braces = stripped.count('}')
+            
+            # Single-line checks also skip block comment continuation lines
+            if not stripped.startswith('*'):
+                # Magic numbers
+                if scan_magic_numbers:
+                    skip_line = None
+                    for match in _MAGIC_NUMBER_RE.finditer(line):
+                        number = int(match.group(1))
+                        if number not in acceptable_numbers:
+                            # Const declarations and GUID keywords exempt every number on the line, so test them once
+                            if skip_line is None:
+                                skip_line = _CONST_ANY_CASE_RE.search(line) is not None or has_guid_keyword(line)
+                            if skip_line:
+                                break
+                            # Check if this number is part of a GUID
+                            if not is_guid_pattern_near(line, match.start(), match.end()):
+                                magic_number_issues.append(Issue(
+                                    file_path=cleaned_path,
+                                    line_number=line_num,
+                                    severity="warning",
+                                    code="BCW012",
+                                    description=f"Magic number '{number}' - consider using a named constant"
+                                ))
                 
+                # Excessive nesting
+                if open_braces and line[:min_indent].isspace():
+                    indent_level = _LEADING_WHITESPACE_RE.match(line).end() // 4
+                    if indent_level > max_nesting:
+                        nesting_issues.append(Issue(
+                            file_path=cleaned_path,
+                            line_number=line_num,
+                            severity="warning",
+                            code="BCW010",
+                            description=f"Excessive nesting level ({indent_level} > {max_nesting}) - consider refactoring"
+                        ))
+            
+            # Empty catch blocks
+            if 'catch' in stripped and open_braces:
+                in_catch = True
+                catch_line = line_num
+                brace_count = open_braces - close_braces
+                has_content = False
+            elif in_catch:
+                brace_count += open_braces - close_braces
+                
+                # Blank and comment lines were skipped above, so this line is content
+                has_content = True
+                
+                if brace_count <= 0:
+                    if not has_content:
+                        empty_catch_issues.append(Issue(
+                            file_path=cleaned_path,
+                            line_number=catch_line,
+                            severity="error",
+                            code="BCS003",
+                            description="Empty catch block found - should handle exceptions properly"
+                        ))
+                    in_catch = False
+            
             # Method detection logic (simplified)
-            if re.search(r'(public|private|protected|internal).*\w+\s*\([^)]*\)', line) and '{' in line:
+            if open_braces and _METHOD_SIGNATURE_RE.search(line):
                 if in_method and complexity > 10:
-                    issues.append(Issue(
-                        file_path=clean_file_path(file_path),
+                    complexity_issues.append(Issue(
+                        file_path=cleaned_path,
                         line_number=method_start,
                         severity="warning",
                         code="BCW040",
@@ -390,13 +491,12 @@ class StringBasedChecker:
                 method_name = extract_method_name(line)
                 
             if in_method:
-                for keyword in complexity_keywords:
-                    complexity += line.lower().count(keyword)
+                complexity += len(_COMPLEXITY_RE.findall(line))
                 
-                if '}' in line and line.count('}') >= line.count('{'):
+                if close_braces and close_braces >= open_braces:
                     if complexity > 10:
-                        issues.append(Issue(
-                            file_path=clean_file_path(file_path),
+                        complexity_issues.append(Issue(
+                            file_path=cleaned_path,
                             line_number=method_start,
                             severity="warning",
                             code="BCW040",
@@ -404,4 +504,20 @@ class StringBasedChecker:
                         ))
                     in_method = False
         
-        return issues
\ No newline at end of file
+        return results
+    
+    def check_empty_catch_blocks(self, file_path: str, content: str, lines: Optional[List[str]] = None) -> List[Issue]:
+        """Check for empty catch blocks - ERROR"""
+        return self.run_fallback_checks(file_path, content, lines)["empty_catch_blocks"]
+    
+    def check_magic_numbers(self, file_path: str, content: str, lines: Optional[List[str]] = None) -> List[Issue]:
+        """Check for magic numbers (hardcoded numbers except common ones) - WARNING"""
+        return self.run_fallback_checks(file_path, content, lines)["magic_numbers"]
+    
+    def check_cyclomatic_complexity(self, file_path: str, content: str, lines: Optional[List[str]] = None) -> List[Issue]:
+        """Check for high cyclomatic complexity - WARNING"""
+        return self.run_fallback_checks(file_path, content, lines)["cyclomatic_complexity"]
+    
+    def check_excessive_nesting(self, file_path: str, content: str, lines: Optional[List[str]] = None) -> List[Issue]:
+        """Check for excessive nesting levels (more than 4 levels) - WARNING"""
+        return self.run_fallback_checks(file_path, content, lines)["excessive_nesting"]
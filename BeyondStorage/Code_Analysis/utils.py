@@ -3,8 +3,26 @@ Utility functions for code analysis
 """
 
 import os
+import re
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import accumulate
 from typing import List
 
+_SKIP_DIRS = frozenset({'.git', '.vs', 'bin', 'obj', 'packages', '.vscode'})
+
+_METHOD_NAME_RE = re.compile(r'\s+(\w+)\s*\(')
+_GUID_PATTERN_RE = re.compile(
+    r'[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}'  # Full GUID
+    r'|"[0-9a-fA-F-]+"'  # Quoted hex string that might be a GUID
+    r'|\{[0-9a-fA-F-]+\}'  # GUID in braces
+)
+# Common GUID-related keywords ('[assembly:' is covered by 'assembly:'); ASCII case folding matches str.lower() here
+_GUID_KEYWORD_RE = re.compile(r'guid|assembly:|typelib', re.IGNORECASE | re.ASCII)
+
+# Every issue in a file cleans the same path; relpath (abspath + splitdrive per call) is worth caching.
+# Relative results depend on the working directory, which the checker never changes mid-run.
+@lru_cache(maxsize=4096)
 def clean_file_path(file_path: str) -> str:
     """Clean file path by removing './' or '.\\' prefixes and converting to relative path"""
     if file_path.startswith('./') or file_path.startswith('.\\'):
@@ -15,51 +33,82 @@ def clean_file_path(file_path: str) -> str:
     return file_path
 
 
+def read_source_file(file_path: str) -> str:
+    """
+    Read a UTF-8 source file as text with '\\n' line endings.
+    Reads raw bytes and decodes them in one call, which is cheaper than text-mode reading
+    but yields the same string (universal newlines: '\\r\\n' and lone '\\r' become '\\n').
+    """
+    with open(file_path, 'rb') as f:
+        data = f.read()
+    # '\r' is a single byte that never occurs inside a UTF-8 multi-byte sequence, so newlines
+    # are normalized on the raw bytes, before decoding widens them into a str
+    if b'\r' in data:
+        data = data.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+    return data.decode('utf-8')
+
+
+def iter_cs_files(root_dir: str = "."):
+    """Yield .cs file paths under root_dir as the directories are listed, in traversal order"""
+    # os.scandir's DirEntry answers is_dir() from the directory listing itself, so unlike
+    # os.walk no extra stat is needed per entry; symlinked directories are not descended
+    pending_dirs = [root_dir]
+    while pending_dirs:
+        try:
+            entries = os.scandir(pending_dirs.pop())
+        except OSError:
+            continue
+        
+        with entries:
+            for entry in entries:
+                if entry.is_dir():
+                    if entry.name not in _SKIP_DIRS and not entry.is_symlink():
+                        pending_dirs.append(entry.path)
+                elif entry.name.endswith('.cs'):
+                    yield entry.path
+
+
 def find_cs_files(root_dir: str = ".") -> List[str]:
     """Find all .cs files in the directory and subdirectories"""
-    cs_files = []
-    for root, dirs, files in os.walk(root_dir):
-        dirs[:] = [d for d in dirs if d not in {'.git', '.vs', 'bin', 'obj', 'packages', '.vscode'}]
-        
-        for file in files:
-            if file.endswith('.cs'):
-                cs_files.append(os.path.join(root, file))
-    
-    return sorted(cs_files)
+    # Sorted so that reports list files in the same order on every platform and run
+    return sorted(iter_cs_files(root_dir))
 
 
+# Cookie-cutter signatures (e.g. "public void Dispose()") repeat across files and methods
+@lru_cache(maxsize=4096)
 def extract_method_name(line: str) -> str:
     """Extract method name from a method signature line"""
-    import re
-    match = re.search(r'\s+(\w+)\s*\(', line)
+    match = _METHOD_NAME_RE.search(line)
     return match.group(1) if match else "unknown"
 
 
 def is_guid_context(line: str, number_start: int, number_end: int) -> bool:
     """Check if a number appears to be part of a GUID"""
-    import re
-    
+    return is_guid_pattern_near(line, number_start, number_end) or has_guid_keyword(line)
+
+
+def is_guid_pattern_near(line: str, number_start: int, number_end: int) -> bool:
+    """Check for a GUID-like pattern in the context around a number"""
     # Get context around the number
     context_start = max(0, number_start - 20)
     context_end = min(len(line), number_end + 20)
-    context = line[context_start:context_end]
-    
-    # Check for GUID patterns
-    guid_patterns = [
-        r'[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}',  # Full GUID
-        r'"[0-9a-fA-F-]+"',  # Quoted hex string that might be a GUID
-        r'\{[0-9a-fA-F-]+\}',  # GUID in braces
-    ]
-    
-    for pattern in guid_patterns:
-        if re.search(pattern, context):
-            return True
     
-    # Check for common GUID-related keywords
-    guid_keywords = ['guid', 'Guid', 'GUID', 'assembly:', '[assembly:', 'typelib']
-    line_lower = line.lower()
-    for keyword in guid_keywords:
-        if keyword.lower() in line_lower:
-            return True
-    
-    return False
\ No newline at end of file
+    return _GUID_PATTERN_RE.search(line, context_start, context_end) is not None
+
+
+def has_guid_keyword(line: str) -> bool:
+    """Check for GUID-related keywords anywhere on the line"""
+    return _GUID_KEYWORD_RE.search(line) is not None
+
+
+def line_start_offsets(lines: List[str]) -> List[int]:
+    """Offsets at which each line starts in the text the lines were split from with '\\n'"""
+    # Each line is followed by a one-character separator; map/accumulate keep the loop in C
+    line_starts = list(accumulate(map((1).__add__, map(len, lines)), initial=0))
+    line_starts.pop()
+    return line_starts
+
+
+def line_number_at(line_starts: List[int], offset: int) -> int:
+    """1-based line number of a text offset, by binary search over line_start_offsets()"""
+    return bisect_right(line_starts, offset)
@@ -1,8 +1,13 @@
 import re
+import csv
 import argparse
 from pathlib import Path
 import os
 import sys
+import fnmatch
+import mmap
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from rich.console import Console
 from rich.panel import Panel
 from rich.progress import Progress, TaskID
@@ -18,6 +23,22 @@ console = Console()
 DEFAULT_OUTPUT_DIR_PREFIX = "00_patches"
 DEFAULT_TARGET_PATTERN = "INF [MODS][Harmony](IL) Generated patch" 
 DEFAULT_FILE_NAME = "output_log_client__yyyy-mm-dd__hh-nn-ss.txt"
+NEWLINE_COUNT_CHUNK_SIZE = 1024 * 1024  # Bytes of the mapped log copied at a time to count lines
+PROGRESS_UPDATE_BYTES = 1024 * 1024  # Bytes scanned between progress bar updates
+PATCH_WRITE_WORKERS = 8  # Threads writing patch files; the writes are I/O-bound and release the GIL
+SUMMARY_TABLE_MAX_ROWS = 200  # Larger extractions are listed in SUMMARY_LISTING_FILE_NAME instead of a console table
+SUMMARY_LISTING_FILE_NAME = "patch_summary.tsv"  # Not .txt, so it can't clash with a patch file
+PATCH_FILE_NEWLINE = os.linesep.encode('ascii')  # Patch files are written in binary, with the platform's line endings
+
+# Compiled once rather than looked up in re's pattern cache on every call
+# Version (_vX.Y.Z_) or log timestamp in an input file name; one pass finds whichever is there
+LOG_FILE_NAME_PATTERN = re.compile(
+    r'_(?P<version>v\d+\.\d+\.\d+)_'
+    r'|output_log_client__(?P<date>\d{4}-\d{2}-\d{2})__(?P<time>\d{2}-\d{2}-\d{2})'
+)
+# Windows invalid chars: < > : " / \ | ? * and also control chars (0-31)
+# Note: parentheses () and commas , are actually valid in Windows filenames
+INVALID_FILENAME_CHARS_PATTERN = re.compile(r'[<>:"/\\|?*\x00-\x1f,]')
 
 WINDOWS_PROFILE_DIR = os.path.expanduser("~")
 SEVEN_DAYS_LOG_PATH = Path(WINDOWS_PROFILE_DIR) / "AppData" / "Roaming" / "7DaysToDie" / "Logs"
@@ -33,37 +54,44 @@ def find_newest_file(directory_path, file_pattern="*.txt"):
             console.print(f"[yellow]Warning:[/yellow] Directory {directory} does not exist.")
             return None
             
-        # Get all files matching the pattern
-        files = list(directory.glob(file_pattern))
+        # Keep the newest matching file by modification time in a single pass over the directory;
+        # scandir entries carry their type (and, on Windows, their stat) from the listing itself
+        newest_path = None
+        newest_mtime = None
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if not fnmatch.fnmatch(entry.name, file_pattern) or not entry.is_file():
+                    continue
+                mtime = entry.stat().st_mtime
+                if newest_mtime is None or mtime > newest_mtime:
+                    newest_path = entry.path
+                    newest_mtime = mtime
         
-        if not files:
+        if newest_path is None:
             console.print(f"[yellow]Warning:[/yellow] No {file_pattern} files found in {directory}")
             return None
             
-        # Return the newest file by modification time
-        newest_file = max(files, key=lambda f: f.stat().st_mtime)
-        return newest_file
+        return Path(newest_path)
             
     except Exception as e:
         console.print(f"[bold red]Error:[/bold red] Failed to find newest file: {e}")
         return None
 
-def extract_version_from_filename(filename):
-    # Look for _vX.Y.Z_ pattern
-    match = re.search(r'_(v\d+\.\d+\.\d+)_', filename)
-    if match:
-        return match.group(1)
-    return None
+def parse_log_file_name(input_file):
+    """Find the version (_vX.Y.Z_ anywhere in the path) or else the log timestamp (in the file name)"""
+    # A version wins wherever it appears, so keep scanning past a timestamp in case one follows
+    name_start = input_file.rfind(Path(input_file).name)
+    timestamp_str = None
+    for match in LOG_FILE_NAME_PATTERN.finditer(input_file):
+        if match.group('version'):
+            return match.group('version'), None
+        if timestamp_str is None and match.start() >= name_start:
+            timestamp_str = f"{match.group('date')}__{match.group('time')}"
+    return None, timestamp_str
 
 def sanitize_filename(name):
-    # Static counter for unnamed method fallbacks
-    if not hasattr(sanitize_filename, 'unnamed_counter'):
-        sanitize_filename.unnamed_counter = 0
-    
     # Replace invalid filename characters with '_'
-    # Windows invalid chars: < > : " / \ | ? * and also control chars (0-31)
-    # Note: parentheses () and commas , are actually valid in Windows filenames
-    sanitized = re.sub(r'[<>:"/\\|?*\x00-\x1f,]', '_', name)
+    sanitized = INVALID_FILENAME_CHARS_PATTERN.sub('_', name)
     
     # Remove leading/trailing whitespace and dots (Windows doesn't like these)
     sanitized = sanitized.strip(' .')
@@ -71,10 +99,8 @@ def sanitize_filename(name):
     # Windows has a path length limit of ~260 chars, filename portion should be much shorter
     # Truncate to 200 chars to be safe, keeping the extension area clear
     if len(sanitized) > 200:
-        sanitized = sanitized[:200]
-    
-    # Ensure we don't end with a space or dot after truncation
-    sanitized = sanitized.rstrip(' .')
+        # Ensure we don't end with a space or dot after truncation; the strip above already covers shorter names
+        sanitized = sanitized[:200].rstrip(' .')
     
     # Handle empty result with numbered fallback
     if not sanitized:
@@ -83,6 +109,23 @@ def sanitize_filename(name):
     
     return sanitized
 
+# Static counter for unnamed method fallbacks, set up once rather than checked on every call
+sanitize_filename.unnamed_counter = 0
+
+def count_newlines(data, start, end):
+    """Count the newlines in data[start:end], copying at most NEWLINE_COUNT_CHUNK_SIZE bytes at a time"""
+    # mmap objects have find() but no count(), and slicing a whole span out of one could copy most of the log
+    newline_count = 0
+    for chunk_start in range(start, end, NEWLINE_COUNT_CHUNK_SIZE):
+        newline_count += data[chunk_start:min(chunk_start + NEWLINE_COUNT_CHUNK_SIZE, end)].count(b"\n")
+    return newline_count
+
+def write_patch_file(file_path, content):
+    """Write one extracted patch, already encoded, in a single write"""
+    # Opening for writing truncates any file left by an earlier run or an earlier patch of the same name
+    with open(file_path, 'wb') as out_file:
+        out_file.write(content)
+
 def process_patch_line(line, line_number, target):
     """Process a single line containing patch information"""
     # Get the part after the target string
@@ -91,9 +134,8 @@ def process_patch_line(line, line_number, target):
         console.print(f"[yellow]Warning[/yellow] (line {line_number}): No terms found after '{target}'.")
         return None, None
         
-    # Split by '::'
-    terms = [term.strip() for term in rest.split("::")]
-    last_two = terms[-2:] if len(terms) >= 2 else terms
+    # Split by '::', from the right: only the last two terms are used, however many came before
+    last_two = [term.strip() for term in rest.rsplit("::", 2)[-2:]]
     
     if len(last_two) != 2:
         console.print(f"[yellow]Warning[/yellow] (line {line_number}): Expected two terms after '{target}', found {len(last_two)}:")
@@ -116,47 +158,97 @@ def extract_patches(input_file, output_dir, target_pattern):
     methods_found = []
     
     try:
-        # Count total lines for progress bar
-        total_lines = sum(1 for _ in open(input_file, 'r', encoding='utf-8'))
+        # Progress is measured in bytes scanned, so the file isn't read an extra time just to count its lines
+        total_bytes = os.path.getsize(input_file)
+        target_bytes = target_pattern.encode('utf-8')
+        # Normalized once (as Path would) so each patch file path is a plain string join
+        output_base = str(Path(output_dir))
         
-        with open(input_file, 'r', encoding='utf-8') as f:
-            with Progress() as progress:
-                task = progress.add_task("[cyan]Processing log file...", total=total_lines)
+        # The log is mapped rather than iterated line by line: C-level searches jump straight from one
+        # target match to the next, and only matched lines are decoded.
+        # An empty file can't be mapped, and has nothing to extract anyway.
+        with open(input_file, 'rb') as f, \
+             (mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if total_bytes else nullcontext(b"")) as log_data:
+            # Patch files are written by a thread pool, so the scan carries on while they're being written
+            with Progress() as progress, ThreadPoolExecutor(max_workers=PATCH_WRITE_WORKERS) as write_pool:
+                task = progress.add_task("[cyan]Processing log file...", total=total_bytes)
+                pending_writes = {}  # Latest write submitted for each patch file, keyed by its normalized path
+                
+                data_length = len(log_data)
+                position = 0  # Start of the next line to scan
+                reported_position = 0  # Offset last shown on the progress bar
+                line_number = 0  # Lines scanned up to position (patch body lines are not counted, as before)
                 
-                for line_number, line in enumerate(f, start=1):
-                    progress.update(task, advance=1)
+                while True:
+                    match_start = log_data.find(target_bytes, position)
+                    if match_start == -1:
+                        break
                     
-                    if target_pattern in line:
-                        patched_method, _ = process_patch_line(line, line_number, target_pattern)
-                        
-                        if not patched_method:
-                            continue
-                        
-                        safe_method = sanitize_filename(patched_method)
-                        file_path = Path(output_dir) / f"{safe_method}.txt"
-                        methods_found.append((patched_method, line_number, file_path))
-                        
-                        # Delete the file if it exists
-                        if file_path.exists():
-                            file_path.unlink()
-                            
-                        # Collect following lines until blank or EOF
-                        lines_to_write = []
-                        lines_to_write.append(patched_method + ":\n")
-                        for following_line in f:
-                            progress.update(task, advance=1)
-                            if following_line.strip() == "":
-                                break
-                            lines_to_write.append(following_line.rstrip())
-                            
-                        # Write to file
-                        with open(file_path, 'w', encoding='utf-8') as out_file:
-                            out_file.write('\n'.join(lines_to_write))
+                    line_start = log_data.rfind(b"\n", position, match_start) + 1
+                    if line_start == 0:
+                        line_start = position
+                    line_end = log_data.find(b"\n", match_start)
+                    if line_end == -1:
+                        line_end = data_length
+                    line_number += count_newlines(log_data, position, line_start) + 1
+                    position = line_end + 1
+                    # Each update takes the progress bar's lock; logs with many patches only report
+                    # once per PROGRESS_UPDATE_BYTES scanned
+                    if line_start - reported_position >= PROGRESS_UPDATE_BYTES:
+                        progress.update(task, completed=line_start)
+                        reported_position = line_start
+                    
+                    line = log_data[line_start:line_end].decode('utf-8')
+                    patched_method, _ = process_patch_line(line, line_number, target_pattern)
+                    
+                    if not patched_method:
+                        continue
+                    
+                    safe_method = sanitize_filename(patched_method)
+                    file_path = os.path.join(output_base, safe_method + ".txt")
+                    methods_found.append((patched_method, line_number, file_path))
+                    
+                    # Collect following lines until blank or EOF, as the log's own UTF-8 bytes
+                    lines_to_write = []
+                    lines_to_write.append(patched_method.encode('utf-8') + b":" + PATCH_FILE_NEWLINE)
+                    while position < data_length:
+                        following_end = log_data.find(b"\n", position)
+                        if following_end == -1:
+                            following_end = data_length
+                        following_line = log_data[position:following_end]
+                        position = following_end + 1
+                        if following_line.strip() == b"":
+                            break
+                        lines_to_write.append(following_line.rstrip())
                         
-                        patch_count += 1
+                    # A later patch of the same name still replaces the earlier one: its write
+                    # waits until the earlier write to that file is done. On Windows, names that
+                    # differ only in case are the same file, so writes are keyed on the normcased path
+                    write_key = os.path.normcase(os.path.abspath(file_path))
+                    previous_write = pending_writes.get(write_key)
+                    if previous_write is not None:
+                        previous_write.result()
+                    pending_writes[write_key] = write_pool.submit(
+                        write_patch_file, file_path, PATCH_FILE_NEWLINE.join(lines_to_write))
+                    
+                    patch_count += 1
+                
+                # Surface any write error, as writing inline would have
+                for pending_write in pending_writes.values():
+                    pending_write.result()
+                
+                progress.update(task, completed=total_bytes)
                         
-        # Display summary in a table
-        if patch_count > 0:
+        # Display summary in a table; a very long one takes a while to lay out and is unreadable
+        # in a console anyway, so past SUMMARY_TABLE_MAX_ROWS the listing goes to a file instead
+        if patch_count > SUMMARY_TABLE_MAX_ROWS:
+            summary_file = os.path.join(output_base, SUMMARY_LISTING_FILE_NAME)
+            with open(summary_file, 'w', encoding='utf-8', newline='') as listing:
+                writer = csv.writer(listing, delimiter='\t')
+                writer.writerow(["Method Name", "Line", "Output File"])
+                writer.writerows(methods_found)
+            console.print(f"{patch_count} patches extracted (table suppressed), listed in: [blue]{summary_file}[/blue]")
+        elif patch_count > 0:
             table = Table(title=f"[bold green]Patch Extraction Summary[/bold green]")
             table.add_column("Method Name", style="cyan")
             table.add_column("Line", style="magenta")
@@ -180,27 +272,27 @@ def extract_patches(input_file, output_dir, target_pattern):
         console.print(f"[bold red]Error:[/bold red] Could not read the file '{input_file}'. Reason: {e}")
         return 1
 
+def ensure_output_directory(output_dir):
+    """Create the output directory (and parents) unless it already exists"""
+    # Re-runs for the same version find the directory in place; one isdir() stat settles that,
+    # instead of a parent check, a failing mkdir and a follow-up check
+    if not os.path.isdir(output_dir):
+        os.makedirs(output_dir, exist_ok=True)
+
 def setup_output_directory(input_file, output_prefix):
     """Set up and create the output directory based on version in filename"""
     # First check for version pattern
-    version = extract_version_from_filename(input_file)
+    version, timestamp_str = parse_log_file_name(input_file)
     if version:
         console.print(f"Extracted version: [bold green]{version}[/bold green]")
         output_dir = f"{output_prefix}_{version}"
-        Path(output_dir).mkdir(parents=True, exist_ok=True)
+        ensure_output_directory(output_dir)
         return output_dir
     else:
         DEFAULT_VERSION_PREFIX = "v2.5.x__"  # This should match the mod series versioning for major.minor
 
-        # Try to extract timestamp from filename if it matches the expected format
-        timestamp_match = re.search(r'output_log_client__(\d{4}-\d{2}-\d{2})__(\d{2}-\d{2}-\d{2})', Path(input_file).name)
-        
-        if timestamp_match:
-            # Extract date and time from the filename
-            date_str = timestamp_match.group(1)
-            time_str = timestamp_match.group(2)
-            timestamp_str = f"{date_str}__{time_str}"
-            
+        # Use the timestamp from the filename if it matches the expected format
+        if timestamp_str:
             default_version = DEFAULT_VERSION_PREFIX + timestamp_str
             console.print(f"Extracted timestamp from filename: [bold green]{timestamp_str}[/bold green]")
         else:
@@ -209,7 +301,7 @@ def setup_output_directory(input_file, output_prefix):
             console.print(f"No timestamp pattern found in filename, using current time")
         
         output_dir = f"{output_prefix}_{default_version}"
-        Path(output_dir).mkdir(parents=True, exist_ok=True)
+        ensure_output_directory(output_dir)
         console.print(f'[yellow]Version string not found[/yellow] in filename "{input_file}"')
         console.print(f'Using default version: [blue]{default_version}[/blue]')
         console.print(f'Output directory: [blue]{output_dir}[/blue]')
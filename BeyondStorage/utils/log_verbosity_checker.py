@@ -6,7 +6,11 @@ This helps identify logging calls that might impact performance in release build
 
 import os
 import re
+import sys
 import glob
+import json
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -15,6 +19,13 @@ BASE_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "Source")
 OUTPUT_DIRECTORY = os.path.dirname(__file__) + "/log_check_results"  # Output files to the same directory as this script
 MAX_RESULT_FILES = 5
 SKIP_LIST_FILE = os.path.join(os.path.dirname(__file__), "log_check_skip_list.cfg")
+REPORT_WRITE_BUFFER_SIZE = 64 * 1024  # Detailed reports run to thousands of lines; fewer, larger writes
+PARALLEL_MIN_FILES = 10  # Below this, worker start-up costs more than scanning the files serially
+SCAN_CACHE_FILE = os.path.join(OUTPUT_DIRECTORY, "log_check_cache.json")  # Per-file scan results of the previous run
+SCAN_CACHE_VERSION = 1  # Bump when the cached scan results change shape or meaning
+
+# Both separators a skip list may use, mapped to the platform's
+SKIP_LIST_SEPARATORS = str.maketrans({'\\': os.sep, '/': os.sep})
 
 # ModLogger methods to search for
 MODLOGGER_METHODS = [
@@ -24,6 +35,12 @@ MODLOGGER_METHODS = [
     "ModLogger.Warning"
 ]
 
+# Any of the methods above; one pass over a file's content finds every line that holds a call.
+# The names are plain ASCII, so no Unicode matching rules are needed.
+MODLOGGER_CALL_PATTERN = re.compile("|".join(re.escape(method) for method in MODLOGGER_METHODS), re.ASCII)
+# A line holding several methods reports the one listed first above
+MODLOGGER_METHOD_RANKS = {method: rank for rank, method in enumerate(MODLOGGER_METHODS)}
+
 def load_skip_list():
     """
     Load the list of files to skip from the skip list file.
@@ -40,13 +57,10 @@ def load_skip_list():
     
     try:
         with open(SKIP_LIST_FILE, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                # Skip empty lines and comments
-                if line and not line.startswith('#'):
-                    # Normalize path separators
-                    normalized_path = line.replace('\\', os.sep).replace('/', os.sep)
-                    skip_files.add(normalized_path)
+            stripped_lines = [line.strip() for line in f.read().split('\n')]
+        # Skip empty lines and comments; normalize path separators with one translate per path
+        skip_files = {line.translate(SKIP_LIST_SEPARATORS) for line in stripped_lines
+                      if line and not line.startswith('#')}
     except (IOError, UnicodeDecodeError) as e:
         print(f"Warning: Could not read skip list file {SKIP_LIST_FILE}: {e}")
     
@@ -91,8 +105,9 @@ def cleanup_old_results():
     result_files = glob.glob(pattern)
     
     if len(result_files) > MAX_RESULT_FILES:
-        # Sort by modification time (oldest first)
-        result_files.sort(key=os.path.getmtime)
+        # Sort by the timestamp in the file names (oldest first); fixed-width
+        # %Y%m%d_%H%M%S stamps order as strings, so no file needs a stat
+        result_files.sort()
         # Remove excess files
         for file_to_remove in result_files[:-MAX_RESULT_FILES]:
             try:
@@ -100,44 +115,59 @@ def cleanup_old_results():
             except OSError as e:
                 pass  # Silent cleanup
 
-def is_wrapped_in_debug(lines, line_index):
+def find_debug_directives(lines):
     """
-    Check if the current line is wrapped in #if DEBUG/#endif statements.
+    Find the preprocessor lines that decide whether a line is wrapped in #if DEBUG/#endif,
+    in one pass over the file.
     
     Args:
         lines: List of all lines in the file
+        
+    Returns:
+        tuple: (directive_indexes, directive_kinds) - ascending line indexes of the #if/#endif lines
+               and, for each, "DEBUG" (#if DEBUG), "IF" (any other #if) or "ENDIF"
+    """
+    directive_indexes = []
+    directive_kinds = []
+    for line_index, line in enumerate(lines):
+        # Every directive holds a '#'; most lines don't, and the search is cheaper than a strip
+        if '#' not in line:
+            continue
+        line = line.strip()
+        # "#if " leads both kinds of #if, so one prefix test dispatches them and
+        # the word after it tells "#if DEBUG" apart
+        if line[:4] == "#if ":
+            kind = "DEBUG" if line[4:9] == "DEBUG" else "IF"
+        elif line[:6] == "#endif":
+            kind = "ENDIF"
+        else:
+            continue
+        directive_indexes.append(line_index)
+        directive_kinds.append(kind)
+    return directive_indexes, directive_kinds
+
+def is_wrapped_in_debug(directives, line_index):
+    """
+    Check if the current line is wrapped in #if DEBUG/#endif statements.
+    
+    Args:
+        directives: (directive_indexes, directive_kinds) from find_debug_directives for the file
         line_index: Index of the line containing ModLogger call
         
     Returns:
         bool: True if wrapped in DEBUG statements, False otherwise
     """
-    # Look backwards for #if DEBUG
-    debug_if_found = False
-    for i in range(line_index - 1, -1, -1):
-        line = lines[i].strip()
-        if line.startswith("#if DEBUG"):
-            debug_if_found = True
-            break
-        elif line.startswith("#endif"):
-            # Found endif before if DEBUG, so not wrapped
-            break
-        elif line.startswith("#if ") and not line.startswith("#if DEBUG"):
-            # Found different preprocessor directive, stop looking
-            break
-    
-    if not debug_if_found:
-        return False
+    directive_indexes, directive_kinds = directives
+    position = bisect_left(directive_indexes, line_index)
     
-    # Look forwards for #endif
-    for i in range(line_index + 1, len(lines)):
-        line = lines[i].strip()
-        if line.startswith("#endif"):
-            return True
-        elif line.startswith("#if "):
-            # Found another preprocessor directive, stop looking
-            break
+    # The nearest directive above must be #if DEBUG (an #endif or a different #if means not wrapped)
+    if position == 0 or directive_kinds[position - 1] != "DEBUG":
+        return False
     
-    return False
+    # The nearest directive below must be #endif (another #if means not wrapped)
+    if position < len(directive_indexes) and directive_indexes[position] == line_index:
+        position += 1
+    return position < len(directive_kinds) and directive_kinds[position] == "ENDIF"
 
 def is_commented_out(line_content):
     """
@@ -183,43 +213,166 @@ def scan_file(file_path):
     unwrapped_calls = []
     
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
+        # One raw read and one decode; the text-mode reader would decode chunk by chunk.
+        # Unbuffered: read() of a whole file sizes one read from fstat, so a buffer only adds a copy
+        with open(file_path, 'rb', buffering=0) as f:
+            data = f.read()
+        # Most files never mention ModLogger; one byte search rejects them before any decoding
+        if b'ModLogger' not in data:
+            return unwrapped_calls
+        # Same newlines as text-mode reading ('\r' never occurs inside a UTF-8 multi-byte sequence)
+        if b'\r' in data:
+            data = data.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+        content = data.decode('utf-8')
     except (UnicodeDecodeError, IOError) as e:
         return unwrapped_calls
     
-    for line_index, line in enumerate(lines):
-        line_content = line.strip()
-        
-        # Skip empty lines
-        if not line_content:
-            continue
+    # Only lines holding a ModLogger call can report anything, so visit just those: the regex
+    # scans the whole content once, and newlines are counted between consecutive matches.
+    # The matches also tell which method each line reports, so lines need no per-method search.
+    candidate_indexes = []
+    candidate_methods = []
+    line_index = 0
+    scanned_to = 0
+    for match in MODLOGGER_CALL_PATTERN.finditer(content):
+        line_index += content.count('\n', scanned_to, match.start())
+        scanned_to = match.start()
+        method = match.group()
+        if not candidate_indexes or candidate_indexes[-1] != line_index:
+            candidate_indexes.append(line_index)
+            candidate_methods.append(method)
+        elif MODLOGGER_METHOD_RANKS[method] < MODLOGGER_METHOD_RANKS[candidate_methods[-1]]:
+            candidate_methods[-1] = method
+    
+    if not candidate_indexes:
+        return unwrapped_calls
+    
+    lines = content.split('\n')
+    
+    # One sweep over the file locates the #if/#endif lines; each candidate then finds its
+    # nearest directives by binary search instead of scanning the file up and down
+    directives = find_debug_directives(lines)
+    
+    # Only count once per line even if multiple methods present
+    for line_index, method in zip(candidate_indexes, candidate_methods):
+        line_content = lines[line_index].strip()
         
         # Skip commented out lines
         if is_commented_out(line_content):
             continue
         
-        # Check if line contains any ModLogger method call
-        for method in MODLOGGER_METHODS:
-            if method in line_content:
-                # Check if this call is wrapped in DEBUG statements
-                if not is_wrapped_in_debug(lines, line_index):
-                    unwrapped_calls.append((
-                        line_index + 1,  # 1-based line numbers
-                        line_content,
-                        method
-                    ))
-                break  # Only count once per line even if multiple methods present
+        # Check if this call is wrapped in DEBUG statements
+        if not is_wrapped_in_debug(directives, line_index):
+            unwrapped_calls.append((
+                line_index + 1,  # 1-based line numbers
+                line_content,
+                method
+            ))
     
     return unwrapped_calls
 
-def scan_directory(base_dir, skip_files):
+def iter_cs_files(base_dir):
+    """
+    Yield the paths of all C# files under a directory, the same files glob's "**/*.cs" finds.
+    
+    Args:
+        base_dir: Directory to walk
+        
+    Yields:
+        str: Path of each .cs file, joined onto base_dir
+    """
+    # os.scandir's entries know their type from the directory listing, so no per-entry stat
+    # is needed; like glob, hidden (dot) entries are skipped and symlinked directories followed
+    pending_dirs = [base_dir]
+    while pending_dirs:
+        try:
+            entries = os.scandir(pending_dirs.pop())
+        except OSError:
+            continue
+        
+        with entries:
+            for entry in entries:
+                if entry.name.startswith('.'):
+                    continue
+                if entry.is_dir():
+                    pending_dirs.append(entry.path)
+                elif entry.name.endswith('.cs'):
+                    yield entry.path
+
+def scan_cache_signature(base_dir):
+    """
+    Describe everything besides a file's own content that its scan result depends on.
+    
+    Args:
+        base_dir: Base directory the cached relative paths belong to
+        
+    Returns:
+        list: JSON-compatible signature; cached results only apply under an equal one
+    """
+    script_stat = os.stat(__file__)
+    return [SCAN_CACHE_VERSION, os.path.abspath(base_dir), script_stat.st_mtime_ns, script_stat.st_size]
+
+def file_cache_key(file_path):
+    """
+    Identify a file's current content by its modification time and size.
+    
+    Args:
+        file_path: Path of the file
+        
+    Returns:
+        list: [mtime_ns, size], or None if the file cannot be stat'ed
+    """
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+def load_scan_cache(cache_signature):
+    """
+    Load the per-file scan results saved by the previous run.
+    
+    Args:
+        cache_signature: Signature from scan_cache_signature for this run
+        
+    Returns:
+        dict: Maps relative paths to [file_key, calls]; empty if there is no usable cache
+    """
+    try:
+        with open(SCAN_CACHE_FILE, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        if cache["signature"] == cache_signature:
+            return cache["files"]
+    except (OSError, ValueError, TypeError, KeyError):
+        pass
+    return {}
+
+def save_scan_cache(cache_signature, cached_files):
+    """
+    Save the per-file scan results for the next run; written aside and renamed so a partial file is never read.
+    
+    Args:
+        cache_signature: Signature from scan_cache_signature for this run
+        cached_files: Maps relative paths to [file_key, calls]
+    """
+    temp_file = SCAN_CACHE_FILE + ".tmp"
+    try:
+        os.makedirs(OUTPUT_DIRECTORY, exist_ok=True)
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump({"signature": cache_signature, "files": cached_files}, f)
+        os.replace(temp_file, SCAN_CACHE_FILE)
+    except OSError as e:
+        print(f"Warning: Could not write scan cache file {SCAN_CACHE_FILE}: {e}")
+
+def scan_directory(base_dir, skip_files, use_cache=True):
     """
     Scan all C# files in the specified directory and subdirectories.
     
     Args:
         base_dir: Base directory to start scanning from
         skip_files: Set of file paths to skip (relative to base_dir)
+        use_cache: Reuse the previous run's results for files unchanged since then, and save this run's for the next;
+                   when False the cache file is neither read nor written
         
     Returns:
         tuple: (results_dict, skipped_files_dict) where results_dict maps file paths to lists of unwrapped calls
@@ -230,20 +383,61 @@ def scan_directory(base_dir, skip_files):
     
     results = {}
     skipped_files_found = set()
-    cs_files = glob.glob(os.path.join(base_dir, "**", "*.cs"), recursive=True)
-    
-    for file_path in cs_files:
+    # Walked paths all start with base_dir plus a separator, so the part after that prefix is
+    # already the relative path relpath would compute (names joined with os.sep)
+    prefix_length = len(os.path.join(base_dir, ''))
+    
+    # Files unchanged since the previous run (same mtime and size) reuse its result
+    cache_signature = scan_cache_signature(base_dir)
+    cached_files = load_scan_cache(cache_signature) if use_cache else {}
+    scanned_files = {}
+    
+    rel_paths = []
+    file_paths = []
+    file_keys = []
+    for file_path in iter_cs_files(base_dir):
         # Get relative path for comparison with skip list
-        rel_path = os.path.relpath(file_path, base_dir)
+        rel_path = file_path[prefix_length:]
         
         # Check if this file should be skipped
         if rel_path in skip_files:
             skipped_files_found.add(rel_path)
             continue
         
-        unwrapped_calls = scan_file(file_path)
-        if unwrapped_calls:
-            results[rel_path] = unwrapped_calls
+        file_key = file_cache_key(file_path)
+        cached = cached_files.get(rel_path)
+        if file_key is not None and cached is not None and cached[0] == file_key:
+            scanned_files[rel_path] = cached
+            if cached[1]:
+                results[rel_path] = [tuple(call) for call in cached[1]]
+            continue
+        
+        rel_paths.append(rel_path)
+        file_paths.append(file_path)
+        file_keys.append(file_key)
+    
+    # Files are independent, so spread them across one worker process per core.
+    # Each file's calls are kept as its scan arrives; the (mostly empty) outcomes
+    # of all files are never gathered into a list first.
+    workers = min(os.cpu_count() or 1, len(file_paths))
+    if workers > 1 and len(file_paths) >= PARALLEL_MIN_FILES:
+        chunksize = max(1, len(file_paths) // (4 * workers))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            file_calls = executor.map(scan_file, file_paths, chunksize=chunksize)
+            for rel_path, file_key, unwrapped_calls in zip(rel_paths, file_keys, file_calls):
+                scanned_files[rel_path] = [file_key, unwrapped_calls]
+                if unwrapped_calls:
+                    results[rel_path] = unwrapped_calls
+    else:
+        for rel_path, file_path, file_key in zip(rel_paths, file_paths, file_keys):
+            unwrapped_calls = scan_file(file_path)
+            scanned_files[rel_path] = [file_key, unwrapped_calls]
+            if unwrapped_calls:
+                results[rel_path] = unwrapped_calls
+    
+    # Rewritten only when something was scanned; files that went away drop out with it
+    if use_cache and (file_paths or len(scanned_files) != len(cached_files)):
+        save_scan_cache(cache_signature, scanned_files)
     
     return results, skipped_files_found
 
@@ -258,102 +452,91 @@ def sort_files_by_count(results, skipped_files_found):
     Returns:
         list: List of tuples (file_path, count_or_skip) sorted by priority
     """
-    # Create combined list with counts and skip markers
-    all_files = []
-    
-    # Add files with unwrapped calls
-    for file_path, calls in results.items():
-        all_files.append((file_path, len(calls)))
-    
-    # Add skipped files
-    for file_path in skipped_files_found:
-        all_files.append((file_path, "SKIP"))
-    
-    # Sort by: 1) Numeric counts (ascending), 2) SKIP files, 3) Alphabetically
-    def sort_key(item):
-        file_path, count = item
-        if count == "SKIP":
-            # SKIP files come after numeric counts, sorted alphabetically
-            return (1, file_path)
-        else:
-            # Numeric counts come first, sorted by count (ascending), then alphabetically
-            return (0, count, file_path)
+    # Numeric counts come first, sorted by count (ascending), then alphabetically;
+    # sorting the two groups separately keeps the sort keys plain tuples and strings
+    counted_files = sorted((len(calls), file_path) for file_path, calls in results.items())
+    
+    # SKIP files come after numeric counts, sorted alphabetically
+    skipped_files = sorted(skipped_files_found)
     
-    return sorted(all_files, key=sort_key)
+    return ([(file_path, count) for count, file_path in counted_files] +
+            [(file_path, "SKIP") for file_path in skipped_files])
 
-def generate_detailed_report(results, skipped_files_found, skip_files):
+def iter_report_lines(results, skipped_files_found, skip_files, report_time=None):
     """
-    Generate a detailed formatted report of the scan results for file output.
+    Yield the detailed report of the scan results line by line, without newlines.
     
     Args:
         results: Dictionary of scan results
         skipped_files_found: Set of files that were actually skipped during scanning
         skip_files: Set of file paths from the skip list
+        report_time: datetime shown in the report header (defaults to now)
         
-    Returns:
-        str: Formatted report text
+    Yields:
+        str: Next line of the report
     """
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    
-    report_lines = [
-        "=" * 80,
-        f"ModLogger Verbosity Check Report - {timestamp}",
-        "=" * 80,
-        f"Base Directory: {BASE_DIR}",
-        f"Skip List File: {SKIP_LIST_FILE}",
-        f"Output Directory: {OUTPUT_DIRECTORY}",
-        f"Files skipped: {len(skipped_files_found)}",
-        f"Total files with unwrapped ModLogger calls: {len(results)}",
-        ""
-    ]
+    timestamp = (report_time or datetime.now()).strftime("%Y-%m-%d %H:%M:%S")
+    
+    yield "=" * 80
+    yield f"ModLogger Verbosity Check Report - {timestamp}"
+    yield "=" * 80
+    yield f"Base Directory: {BASE_DIR}"
+    yield f"Skip List File: {SKIP_LIST_FILE}"
+    yield f"Output Directory: {OUTPUT_DIRECTORY}"
+    yield f"Files skipped: {len(skipped_files_found)}"
+    yield f"Total files with unwrapped ModLogger calls: {len(results)}"
+    yield ""
     
     if skipped_files_found:
-        report_lines.extend([
-            "Skipped files:",
-            "---------------"
-        ])
+        yield "Skipped files:"
+        yield "---------------"
         for skip_file in sorted(skipped_files_found):
-            report_lines.append(f"  {skip_file}")
-        report_lines.append("")
+            yield f"  {skip_file}"
+        yield ""
     
     if not results:
-        report_lines.extend([
-            "✅ All ModLogger calls are properly wrapped in #if DEBUG/#endif blocks!",
-            "   No performance impact from logging in release builds.",
-            ""
-        ])
+        yield "✅ All ModLogger calls are properly wrapped in #if DEBUG/#endif blocks!"
+        yield "   No performance impact from logging in release builds."
+        yield ""
     else:
         total_calls = sum(len(calls) for calls in results.values())
-        report_lines.extend([
-            f"⚠️  Found {total_calls} unwrapped ModLogger calls across {len(results)} files.",
-            "   These calls may impact performance in release builds.",
-            "   (Commented out lines with // are automatically ignored)",
-            ""
-        ])
+        yield f"⚠️  Found {total_calls} unwrapped ModLogger calls across {len(results)} files."
+        yield "   These calls may impact performance in release builds."
+        yield "   (Commented out lines with // are automatically ignored)"
+        yield ""
         
         # Sort files by number of unwrapped calls (ascending)
         sorted_files = sorted(results.items(), key=lambda x: (len(x[1]), x[0]))
         
         for file_path, calls in sorted_files:
-            report_lines.extend([
-                f"📁 {file_path} ({len(calls)} unwrapped calls):",
-                "-" * (len(file_path) + 20)
-            ])
+            yield f"📁 {file_path} ({len(calls)} unwrapped calls):"
+            yield "-" * (len(file_path) + 20)
             
             for line_num, line_content, method in calls:
                 # Truncate very long lines for readability
                 display_line = line_content if len(line_content) <= 100 else line_content[:97] + "..."
-                report_lines.append(f"  Line {line_num:4d}: {method:<20} | {display_line}")
+                yield f"  Line {line_num:4d}: {method:<20} | {display_line}"
             
-            report_lines.append("")
+            yield ""
     
-    report_lines.extend([
-        "=" * 80,
-        "Scan completed successfully.",
-        "=" * 80
-    ])
+    yield "=" * 80
+    yield "Scan completed successfully."
+    yield "=" * 80
+
+def write_report(output_file, report_lines):
+    """
+    Write report lines to a file, newline-separated, as they are produced.
     
-    return "\n".join(report_lines)
+    Args:
+        output_file: Path of the file to write
+        report_lines: Iterable of report lines without newlines
+    """
+    with open(output_file, 'w', encoding='utf-8', buffering=REPORT_WRITE_BUFFER_SIZE) as f:
+        separator = ""
+        for line in report_lines:
+            f.write(separator)
+            f.write(line)
+            separator = "\n"
 
 def print_simple_summary(results, skipped_files_found):
     """
@@ -371,8 +554,8 @@ def print_simple_summary(results, skipped_files_found):
     # Sort files by count (lowest first), then SKIP files, then alphabetically
     sorted_files = sort_files_by_count(results, skipped_files_found)
     
-    for file_path, count in sorted_files:
-        print(f"{file_path}: {count}")
+    # One write for the whole summary rather than a print per file
+    sys.stdout.write("".join(f"{file_path}: {count}\n" for file_path, count in sorted_files))
 
 def main():
     """Main function to run the ModLogger verbosity check."""
@@ -383,25 +566,24 @@ def main():
         # Load skip list
         skip_files = load_skip_list()
         
-        # Scan for unwrapped ModLogger calls
-        results, skipped_files_found = scan_directory(BASE_DIR, skip_files)
+        # Scan for unwrapped ModLogger calls (--no-cache rescans every file instead of reusing unchanged files' results)
+        results, skipped_files_found = scan_directory(BASE_DIR, skip_files, use_cache='--no-cache' not in sys.argv[1:])
         
         # Output simple summary to stdout
         print_simple_summary(results, skipped_files_found)
         
-        # Generate detailed report for file output
-        detailed_report = generate_detailed_report(results, skipped_files_found, skip_files)
-        
-        # Output detailed report to file
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # Output detailed report to file; one clock reading names the file and
+        # dates the report, so the two always agree
+        report_time = datetime.now()
+        timestamp = report_time.strftime("%Y%m%d_%H%M%S")
         output_file = os.path.join(OUTPUT_DIRECTORY, f"log_check_results_{timestamp}.txt")
         
         # Ensure output directory exists
         if not os.path.exists(OUTPUT_DIRECTORY):
             os.makedirs(OUTPUT_DIRECTORY)
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(detailed_report)
+        # Streamed straight into the file, so the whole report is never held in memory at once
+        write_report(output_file, iter_report_lines(results, skipped_files_found, skip_files, report_time))
         
         # Return exit code based on results
         return 1 if results else 0